@@ -1,12 +1,12 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from pydantic import BaseModel
-from typing import Literal
+from typing import Dict, Literal, Optional
 from datetime import datetime
 import uvicorn
-import uuid
 from contextlib import asynccontextmanager
 
 from veriwire.bank_data import DB, Payment
+from veriwire.payee_registry import get_registry
 
 
 def _seed() -> None:
@@ -16,11 +16,36 @@ def _seed() -> None:
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     _seed()
+    get_registry()  # load the blocklist filter now rather than inside the first approve
     yield
 
 
 app = FastAPI(title="VeriWire Bank Sandbox", lifespan=lifespan)
 
+# Idempotency-Key -> first response, so client retries replay rather than re-execute
+_IDEMPOTENT: Dict[str, Dict] = {}
+
+
+def _decide(pid: str, action: str, key: Optional[str]) -> Dict:
+    if key and key in _IDEMPOTENT:
+        return _IDEMPOTENT[key]
+    target = "APPROVED" if action == "approve" else "CANCELED"
+    if action == "approve":
+        p = DB.get_payment(pid)
+        if p and p.status == "PENDING" and get_registry().is_frozen(p.payee):
+            raise HTTPException(409, "payee frozen")
+    try:
+        p = DB.approve(pid) if action == "approve" else DB.cancel(pid)
+    except KeyError:
+        raise HTTPException(404)
+    if p.status != target:
+        # Not transitioned because it wasn't PENDING
+        raise HTTPException(409, f"already {p.status}")
+    body = {"ok": True, "id": p.id, "status": p.status}
+    if key:
+        _IDEMPOTENT[key] = body
+    return body
+
 
 @app.get("/payments/{pid}")
 def get_payment(pid: str):
@@ -31,32 +56,25 @@ def get_payment(pid: str):
 
 
 @app.post("/payments/{pid}/approve")
-def approve_payment(pid: str):
-    try:
-        p = DB.approve(pid)
-    except KeyError:
-        raise HTTPException(404)
-    if p.status != "APPROVED":
-        # Not transitioned because it wasn't PENDING
-        raise HTTPException(409, f"already {p.status}")
-    return {"ok": True, "id": p.id, "status": p.status}
+def approve_payment(pid: str, idempotency_key: Optional[str] = Header(None)):
+    return _decide(pid, "approve", idempotency_key)
 
 
 @app.post("/payments/{pid}/cancel")
-def cancel_payment(pid: str):
-    try:
-        p = DB.cancel(pid)
-    except KeyError:
-        raise HTTPException(404)
-    if p.status != "CANCELED":
-        # Not transitioned because it wasn't PENDING
-        raise HTTPException(409, f"already {p.status}")
-    return {"ok": True, "id": p.id, "status": p.status}
+def cancel_payment(pid: str, idempotency_key: Optional[str] = Header(None)):
+    return _decide(pid, "cancel", idempotency_key)
+
+
+@app.get("/resolve_payment")
+def resolve_payment(q: str, phone: Optional[str] = None, limit: int = 3):
+    matches = DB.resolve_payment_id(q, phone=phone, limit=limit)
+    return {"ok": True, "candidates": [{"id": pid, "cost": cost} for pid, cost in matches]}
 
 
 @app.post("/freeze_payee")
 def freeze_payee(payee: str):
-    return {"ok": True, "payee": payee, "ticket_id": f"TKT-{uuid.uuid4().hex[:8]}"}
+    frozen = get_registry().freeze(payee)
+    return {"ok": True, "payee": payee, "ticket_id": frozen["ticket_id"]}
 
 
 @app.post("/schedule_specialist")
@@ -0,0 +1,68 @@
+"""Hit rate and time-to-first-audio saved by the pre-rendered prompt cache.
+
+FakeTTS stands in for Deepgram with a fixed round-trip; each simulated call
+speaks the greeting plus the scripted verification prompts.
+
+Run: uv run python benchmarks/bench_audio_cache.py
+"""
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veriwire import prompts  # noqa: E402
+from veriwire.audio_cache import AudioCache, FakeTTS, warmup_texts  # noqa: E402
+
+CALLS = 40
+TTS_LATENCY = 0.05  # seconds per synthesis round-trip
+
+
+def _script(rng: random.Random) -> list:
+    turns = [prompts.greeting_segments(prompts.make_phrase()), [prompts.ASK_CARD_LAST4]]
+    if rng.random() < 0.3:
+        turns.append([prompts.REPROMPT_LAST4])
+    read_back = prompts.DECISION_READ_BACK.format(amount=f"${rng.randint(100, 99999):,}.00 USD",
+                                                  payee="ACME Escrow LLC")
+    turns += [[prompts.ASK_PHONE], [read_back]]  # per-payment line: synthesized, never cached
+    if rng.random() < 0.2:
+        turns.append([prompts.REPROMPT_DECISION])
+    return turns
+
+
+def _run(label, speak):
+    rng = random.Random(3)
+    random.seed(3)
+    ttfa = []
+    for _ in range(CALLS):
+        for segments in _script(rng):
+            start = time.perf_counter()
+            speak(segments)
+            ttfa.append(time.perf_counter() - start)
+    print(f"{label:<12} turns={len(ttfa):<4} median TTFA={statistics.median(ttfa) * 1000:6.1f}ms  "
+          f"mean={statistics.mean(ttfa) * 1000:6.1f}ms", end="")
+
+
+def main():
+    tts = FakeTTS(latency=TTS_LATENCY)
+    _run("no cache", lambda segs: [tts.synthesize(s) for s in segs])
+    print()
+
+    with tempfile.TemporaryDirectory() as root:
+        cache = AudioCache(root, tts=FakeTTS(latency=TTS_LATENCY))
+        _run("cold cache", cache.speak)
+        print(f"  hit rate={cache.stats.hit_rate():.0%}  saved={cache.stats.saved_seconds():.2f}s")
+
+    with tempfile.TemporaryDirectory() as root:
+        AudioCache(root, tts=FakeTTS()).warm(warmup_texts(include_phrases=True))
+        cache = AudioCache(root, tts=FakeTTS(latency=TTS_LATENCY))
+        _run("warmed", cache.speak)
+        saved = cache.stats.hits * TTS_LATENCY
+        print(f"  hit rate={cache.stats.hit_rate():.0%}  saved~{saved:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Outbound campaign throughput and queue wait with a local fake dialer.
+
+Simulated call timings are scaled down (1 wall second ~ 10 simulated minutes),
+so the reported rates are per simulated hour.
+
+Run: uv run python benchmarks/bench_campaign.py
+"""
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veriwire.bank_data import BankDB, Payment  # noqa: E402
+from veriwire.campaign import CampaignScheduler, FakeDialer  # noqa: E402
+
+WIRES = 1000
+CUSTOMERS = 400
+SCALE = 600  # simulated seconds per wall second
+
+
+def _seed(db: BankDB, rng: random.Random) -> None:
+    for i in range(WIRES):
+        db.add_payment(Payment(
+            id=f"bench{i:06d}",
+            customer_phone=f"+1415{rng.randrange(CUSTOMERS):07d}",
+            card_last4="0000",
+            payee="Bench Payee LLC",
+            amount_cents=rng.randrange(10_000, 5_000_000),
+            created_at=f"2025-01-01T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00",
+        ))
+
+
+def main():
+    for limit in (10, 25, 50):
+        rng = random.Random(42)
+        db = BankDB()
+        _seed(db, rng)
+        # ~20 s ring, ~60 s call, 65% answer rate; retry no-answers after 5 min
+        dialer = FakeDialer(db=db, answer_rate=0.65, ring_time=20 / SCALE,
+                            talk_time=60 / SCALE, rng=rng)
+        sched = CampaignScheduler(dialer, db=db, max_concurrent=limit, per_customer=1,
+                                  retry_base=300 / SCALE)
+        sched.load()
+        stats = asyncio.run(sched.run())
+        print(f"limit={limit:<3} confirmed={stats.confirmed:<5} unreachable={stats.unreachable:<4} "
+              f"confirmations/h={stats.confirmations_per_hour() / SCALE:7.0f}  "
+              f"wait p50={stats.queue_wait(.5) * SCALE:6.0f}s  p95={stats.queue_wait(.95) * SCALE:6.0f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Time from process start to the bridge's first accepted WebSocket connection.
+
+Run: uv run python benchmarks/bench_cold_start.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from websockets.sync.client import connect
+
+ROOT = Path(__file__).resolve().parents[1]
+PORT = 5055
+
+
+def _first_connection() -> float:
+    env = {**os.environ, "VERIWIRE_PORT": str(PORT)}
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            try:
+                with connect(f"ws://localhost:{PORT}", open_timeout=1):
+                    return time.perf_counter() - start
+            except OSError:
+                if proc.poll() is not None:
+                    raise RuntimeError("bridge exited before accepting a connection")
+                time.sleep(0.005)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    samples = [_first_connection() for _ in range(args.runs)]
+    print(f"time-to-first-accepted-connection: median {statistics.median(samples) * 1000:.0f} ms "
+          f"(min {min(samples) * 1000:.0f}, max {max(samples) * 1000:.0f}) over {args.runs} runs")
+
+
+if __name__ == "__main__":
+    main()
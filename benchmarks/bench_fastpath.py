@@ -0,0 +1,130 @@
+"""Turns per call and time-to-decision: local fast path vs the LLM-only flow.
+
+Simulated callers (with occasional misspoken answers) are driven through
+FastPath against an in-memory BankDB; its local decision time is measured.
+The LLM-only figures replay the same callers' turns, plus the ID echo-confirm
+turn config.json's prompt adds, and count the tool calls that prompt requires
+on each turn. Per-turn latencies (speech, completion, TTS, bank) are the
+assumed constants below, so LLM-only time-to-decision is modeled, not measured.
+
+Run: uv run python benchmarks/bench_fastpath.py
+"""
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veriwire import fastpath, graph  # noqa: E402
+from veriwire.bank_data import BankDB  # noqa: E402
+from veriwire.dfdetect import DeepfakeDetector  # noqa: E402
+from veriwire.fastpath import FastPath  # noqa: E402
+
+CALLS = 500
+SPEECH = 2.0     # caller speaking + STT endpointing, same in both flows
+LLM_RTT = 0.7    # one gpt-4o-mini completion incl. function-call round
+TTS_TTFB = 0.25  # time to first TTS audio when not pre-rendered
+BANK_RTT = 0.02  # one bank tool call
+
+
+def _wire_bank(db: BankDB) -> None:
+    def summary(pid):
+        p = db.get_payment(pid).to_json()
+        return {**p, "amount_readable": f"${p['amount_cents'] / 100:,.2f} {p['currency']}"}
+
+    graph.get_payment_summary = summary
+    graph.approve_wire = lambda pid: db.approve(pid).to_json()
+    graph.cancel_wire = lambda pid: db.cancel(pid).to_json()
+    fastpath.resolve_payment_id = lambda heard: {
+        "candidates": [{"id": pid, "cost": cost} for pid, cost in db.resolve_payment_id(heard)]
+    }
+
+
+def _caller(rng: random.Random, fp: FastPath):
+    """Yield what the caller says in reply to the last prompt."""
+    while not fp.done and not fp.handed_off:
+        stage = fp.stage
+        if stage == "liveness":
+            yield fp.state["phrase"] if rng.random() > 0.1 else "blue something"
+        elif stage == "payment_id":
+            yield "one zero s f 9 1 7 2 6 4"
+        elif stage == "confirm_id":
+            yield "yes"
+        elif not fp.state.get("verified"):
+            yield "one one one one" if rng.random() > 0.1 else "one one one"
+        elif not fp.state.get("phone_verified"):
+            yield "four one five five five five zero one two three"
+        else:
+            yield "approve" if rng.random() > 0.1 else "uh, yes"
+
+
+def _llm_tools(fp: FastPath, before: dict) -> list:
+    """Tool calls the LLM-only flow makes for the turn FastPath just handled.
+
+    Returned as a list of turns: answering the payment ID adds the echo-confirm
+    turn ("I heard 10sf917264, is that right?") the LLM prompt asks for.
+    """
+    stage, st = before["stage"], fp.state
+    if stage == "liveness":
+        return [0]
+    if stage == "payment_id":
+        return [1, 0] if st.get("summary") else [1]  # get_payment_summary, then echo
+    if stage == "confirm_id":
+        return [1]  # resolve_payment_id candidate confirmed, then get_payment_summary
+    if not before["verified"]:
+        return [1]  # verify_last4
+    if not before["phone_verified"]:
+        return [2] if st.get("phone_verified") else [1]  # verify_phone (+ summary read-back)
+    return [1] if st.get("intent") in ("approve", "cancel") else [0]
+
+
+def _llm_seconds(tools: int) -> float:
+    # every turn waits on a completion, each tool call on another one
+    return SPEECH + LLM_RTT * (1 + tools) + BANK_RTT * tools + TTS_TTFB
+
+
+def main():
+    rng = random.Random(11)
+    fast_ttd, fast_turns, fast_local, llm_ttd, llm_turns = [], [], [], [], []
+    handoffs = 0
+    for _ in range(CALLS):
+        _wire_bank(BankDB())
+        fp = FastPath(graph.make_phrase())
+        fp.state["_df"] = DeepfakeDetector(threshold=2.0)
+        local = 0.0
+        llm = []
+        for said in _caller(rng, fp):
+            before = {"stage": fp.stage, "verified": fp.state.get("verified"),
+                      "phone_verified": fp.state.get("phone_verified")}
+            start = time.perf_counter()
+            fp.on_transcript(said)
+            local += time.perf_counter() - start
+            llm += _llm_tools(fp, before)
+        fast = fp.turns * SPEECH + local  # cached prompt audio plays at once
+        turns = fp.turns
+        if fp.handed_off:
+            # an unclear decision goes to the LLM: it answers that turn, then the
+            # caller's "approve" takes one more turn with a tool call (both flows)
+            fast += LLM_RTT + TTS_TTFB + _llm_seconds(1)
+            turns += 1
+            llm.append(1)
+        handoffs += fp.handed_off
+        fast_local.append(local)
+        fast_turns.append(turns)
+        fast_ttd.append(fast)
+        llm_turns.append(len(llm))
+        llm_ttd.append(sum(_llm_seconds(tools) for tools in llm))
+
+    print(f"assumed per turn: speech={SPEECH}s  completion={LLM_RTT}s  TTS first audio={TTS_TTFB}s  "
+          f"bank={BANK_RTT}s")
+    print(f"fast path  turns/call={statistics.mean(fast_turns):.2f}  "
+          f"local compute/call={statistics.median(fast_local) * 1000:.2f}ms (measured)  "
+          f"median time-to-decision={statistics.median(fast_ttd):5.2f}s  handoffs={handoffs}/{CALLS}")
+    print(f"LLM-only   turns/call={statistics.mean(llm_turns):.2f}  "
+          f"median time-to-decision={statistics.median(llm_ttd):5.2f}s  (modeled from assumed latencies)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Approve latency with a large frozen-payee blocklist.
+
+Bulk-imports N synthetic payees into a temporary registry, then times the
+sandbox approve handler against an empty registry and the full one.
+
+Run: uv run python benchmarks/bench_payee_registry.py [--size 10000000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api import bank_sandbox  # noqa: E402
+from veriwire import payee_registry  # noqa: E402
+from veriwire.bank_data import DB, Payment  # noqa: E402
+from veriwire.payee_registry import FrozenPayeeRegistry  # noqa: E402
+
+APPROVALS = 5000
+
+
+def _approve_latency(tag: str):
+    samples = []
+    for i in range(APPROVALS):
+        pid = f"{tag}{i:07d}"
+        DB.add_payment(Payment(id=pid, customer_phone="+14155550123", card_last4="1111",
+                               payee=f"Clean Payee {i} Inc", amount_cents=100))
+        start = time.perf_counter()
+        bank_sandbox.approve_payment(pid, None)
+        samples.append(time.perf_counter() - start)
+    data = sorted(samples)
+    return statistics.median(data) * 1e6, data[int(0.99 * len(data))] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        payee_registry._REGISTRY = FrozenPayeeRegistry(os.path.join(tmp, "empty.db"))
+        p50, p99 = _approve_latency("benchempty")
+        print(f"empty registry      approve p50={p50:6.1f}us  p99={p99:6.1f}us")
+
+        path = os.path.join(tmp, "frozen.db")
+        reg = FrozenPayeeRegistry(path, capacity=args.size)
+        start = time.perf_counter()
+        reg.bulk_import(f"Frozen Payee {i} LLC" for i in range(args.size))
+        print(f"bulk import {len(reg):,} payees in {time.perf_counter() - start:.1f}s "
+              f"({os.path.getsize(path) / 2**20:,.0f} MB on disk)")
+        reg.close()
+
+        start = time.perf_counter()
+        reg = FrozenPayeeRegistry(path)
+        print(f"reopen (Bloom snapshot load) {time.perf_counter() - start:.2f}s")
+        payee_registry._REGISTRY = reg
+
+        p50, p99 = _approve_latency("benchfull")
+        print(f"{args.size:,} blocklist approve p50={p50:6.1f}us  p99={p99:6.1f}us")
+
+        hits = [f"frozen payee {i} inc." for i in range(0, args.size, max(1, args.size // 2000))]
+        start = time.perf_counter()
+        assert all(reg.is_frozen(name) for name in hits)
+        print(f"frozen-hit lookup   mean={(time.perf_counter() - start) / len(hits) * 1e6:6.1f}us")
+        reg.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Accuracy and latency of the fuzzy payment-ID resolver on a synthetic ASR corpus.
+
+IDs follow the demo format (2 digits, 2 letters, 6 digits). Each query is a
+real ID passed through simulated ASR noise: confusable substitutions
+(s/f/x, b/d/t/3, m/n, ...) plus, sometimes, one arbitrary edit.
+
+Run: uv run python benchmarks/bench_pid_index.py [--size 10000000]
+"""
+import argparse
+import random
+import resource
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veriwire.pid_index import CONFUSION_CLASSES, PaymentIdIndex  # noqa: E402
+
+_GROUP = {ch: group for group in CONFUSION_CLASSES for ch in group}
+ALNUM = string.ascii_lowercase + string.digits
+
+
+def _make_id(rng: random.Random) -> str:
+    return (f"{rng.randrange(100):02d}" + rng.choice(string.ascii_lowercase)
+            + rng.choice(string.ascii_lowercase) + f"{rng.randrange(10 ** 6):06d}")
+
+
+def _mishear(pid: str, rng: random.Random) -> str:
+    chars = [rng.choice(_GROUP[ch]) if ch in _GROUP and rng.random() < 0.2 else ch for ch in pid]
+    if rng.random() < 0.3:
+        i = rng.randrange(len(chars))
+        op = rng.choice(["sub", "del", "ins"])
+        if op == "sub":
+            chars[i] = rng.choice(ALNUM)
+        elif op == "del":
+            del chars[i]
+        else:
+            chars.insert(i, rng.choice(ALNUM))
+    return "".join(chars)
+
+
+def _pct(samples, q):
+    data = sorted(samples)
+    return data[min(len(data) - 1, int(q * len(data)))] * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    idx = PaymentIdIndex()
+    ids, phones = [], []
+    start = time.perf_counter()
+    for i in range(args.size):
+        pid = _make_id(rng)
+        phone = f"+1415{rng.randrange(10 ** 7):07d}"
+        idx.add(pid)
+        if i < args.queries:
+            ids.append(pid)
+            phones.append(phone)
+            idx.add(pid, phone)
+    build = time.perf_counter() - start
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"indexed {args.size:,} ids in {build:.1f}s, peak RSS {rss_mb:,.0f} MB")
+
+    for label, constrained in (("open", False), ("by phone", True)):
+        top1 = top3 = 0
+        lat = []
+        for pid, phone in zip(ids, phones):
+            heard = _mishear(pid, rng)
+            t0 = time.perf_counter()
+            found = idx.resolve(heard, phone=phone if constrained else None)
+            lat.append(time.perf_counter() - t0)
+            ranked = [c for c, _ in found]
+            top1 += bool(ranked) and ranked[0] == pid
+            top3 += pid in ranked
+        n = len(ids)
+        print(f"{label:<9} top1={top1 / n:.1%} top3={top3 / n:.1%}  "
+              f"p50={_pct(lat, .5):6.0f}us  p99={_pct(lat, .99):6.0f}us")
+
+
+if __name__ == "__main__":
+    main()
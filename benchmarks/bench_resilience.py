@@ -0,0 +1,80 @@
+"""Tail latency of bank reads against a local fault-injecting sandbox.
+
+Run: uv run python benchmarks/bench_resilience.py
+"""
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from veriwire import bank_tools  # noqa: E402
+from veriwire.bank_data import DB  # noqa: E402
+from veriwire.transport import HttpTransport  # noqa: E402
+
+N = 300
+PID = "10sf917264"
+
+
+class FaultyHandler(BaseHTTPRequestHandler):
+    # ~90% fast, ~8% slow, ~2% stalled: the long tail a real bank backend shows
+    def do_GET(self):
+        roll = random.random()
+        if roll < 0.02:
+            time.sleep(1.0)
+        elif roll < 0.10:
+            time.sleep(0.2)
+        else:
+            time.sleep(random.uniform(0.003, 0.010))
+        p = DB.get_payment(self.path.rsplit("/", 1)[-1])
+        body = json.dumps(p.to_json() if p else {}).encode()
+        self.send_response(200 if p else 404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _pct(samples, q):
+    data = sorted(samples)
+    return data[min(len(data) - 1, int(q * len(data)))] * 1000
+
+
+def _run(label, fn):
+    samples = []
+    for _ in range(N):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    print(f"{label:<10} p50={_pct(samples, .5):7.1f}ms  p95={_pct(samples, .95):7.1f}ms  "
+          f"p99={_pct(samples, .99):7.1f}ms  mean={statistics.mean(samples) * 1000:7.1f}ms")
+
+
+def main():
+    random.seed(7)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FaultyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    bank_tools.set_transport(HttpTransport(base))
+
+    def single():
+        r = requests.get(f"{base}/payments/{PID}", timeout=5)
+        r.raise_for_status()
+
+    _run("single", single)
+    _run("hedged", lambda: bank_tools.get_payment_summary(PID))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Per-call latency and throughput of the bank transports.
+
+Serves api.bank_sandbox with uvicorn on loopback TCP and on a Unix socket,
+and compares them with the in-process transport on the same read.
+
+Run: uv run python benchmarks/bench_transport.py
+"""
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from api.bank_sandbox import app  # noqa: E402
+from veriwire.transport import HttpTransport, InProcessTransport, UnixSocketTransport  # noqa: E402
+
+CALLS = 2000
+THREADS = 8
+PATH = "/payments/10sf917264"
+
+
+def _serve(**kwargs) -> uvicorn.Server:
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", **kwargs))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _bench(label, transport):
+    for _ in range(50):
+        transport.request("GET", PATH)
+    lat = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        transport.request("GET", PATH)
+        lat.append(time.perf_counter() - start)
+    lat.sort()
+
+    def worker(n):
+        for _ in range(n):
+            transport.request("GET", PATH)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(THREADS) as pool:
+        list(pool.map(worker, [CALLS // THREADS] * THREADS))
+    rps = CALLS / (time.perf_counter() - start)
+    print(f"{label:<10} p50={statistics.median(lat) * 1e6:8.1f}us  p99={lat[int(.99 * len(lat))] * 1e6:8.1f}us  "
+          f"throughput({THREADS} threads)={rps:9.0f} calls/s")
+
+
+def main():
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        sock = os.path.join(tmp, "bank.sock")
+        tcp = _serve(host="127.0.0.1", port=port)
+        uds = _serve(uds=sock)
+        try:
+            _bench("http", HttpTransport(f"http://127.0.0.1:{port}"))
+            _bench("uds", UnixSocketTransport(sock))
+            _bench("inprocess", InProcessTransport())
+        finally:
+            tcp.should_exit = uds.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Per-module import cost of a module (default: the voice bridge).
+
+Runs a fresh interpreter under `python -X importtime` and reports the slowest
+imports by cumulative time, plus totals per top-level package.
+
+Run: uv run python benchmarks/profile_imports.py [module] [--top 15]
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def profile(module: str):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cum_us), depth))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("module", nargs="?", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    rows = profile(args.module)
+    total = next((cum for name, _, cum, _ in rows if name == args.module), 0)
+    print(f"import {args.module}: {total / 1000:.1f} ms")
+
+    print("\nslowest imports (cumulative):")
+    for name, self_us, cum_us, depth in sorted(rows, key=lambda r: -r[2])[1:args.top + 1]:
+        print(f"  {cum_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms self  {name}")
+
+    packages = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        packages[name.split(".")[0]] += self_us
+    print("\nself time by top-level package:")
+    for pkg, us in sorted(packages.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {us / 1000:8.1f} ms  {pkg}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,32 @@ import ssl # to handle SSL/TLS encryption for secure communication
 import os # to access environment variables (used for API keys)
 from dotenv import load_dotenv # to load environment variables from a .env file (used for API keys)
 
-from veriwire.bank_tools import FUNCTION_MAP
+from veriwire.bank_tools import FUNCTION_MAP, conflict_detail
+from veriwire.resilience import CircuitOpenError, is_retryable
 from veriwire.session import SESSIONS
 from veriwire.graph import make_phrase
-from veriwire.storage import init_db, log_event
+from veriwire.prompts import greeting_segments, greeting_text
+from veriwire.audio_cache import get_cache, stream_to_twilio, SAMPLE_RATE
+from veriwire.fastpath import FastPath
 
 load_dotenv()
 
+PORT = int(os.getenv("VERIWIRE_PORT", "5000"))
+
+# Hybrid mode: scripted verification turns are answered locally, the LLM only takes free-form dialogue
+HYBRID = os.getenv("VERIWIRE_HYBRID", "0") == "1"
+
+def log_event(streamsid, kind, data=None): # audit log; SQLAlchemy loads on first use (normally in warm_up, after bind)
+    from veriwire.storage import log_event as store_event
+    store_event(streamsid, kind, data)
+
+def warm_up(): # heavy setup that no caller should wait on; runs in a thread once the listener is bound
+    try:
+        from veriwire.storage import init_db
+        init_db()
+    except Exception as e: # nothing awaits this thread; report it (the first log_event retries the setup)
+        print(f"Warm-up failed: {e!r}")
+
 def sts_connect(): # function to connect to the WebSocket server to communicate with the Deepgram API
   api_key = os.getenv("DEEPGRAM_API_KEY") # get the API key from the environment variables
   if not api_key:
@@ -27,6 +46,17 @@ def sts_connect(): # function to connect to the WebSocket server to communicate
   )
   return sts_ws # return the WebSocket connection
 
+def stt_connect(): # plain streaming STT used while the fast path owns the call (hybrid mode)
+  api_key = os.getenv("DEEPGRAM_API_KEY")
+  if not api_key:
+      raise Exception("DEEPGRAM_API_KEY environment variable is not set")
+
+  return websockets.connect(
+      "wss://api.deepgram.com/v1/listen?model=nova-3&encoding=mulaw&sample_rate=8000"
+      "&smart_format=true&interim_results=false&endpointing=300",
+      subprotocols=["token", api_key]
+  )
+
 def load_config(): # function to load the config data from the config.json file
     with open("config.json", "r") as f: # open the config.json file
         return json.load(f) # return the config data as a dictionary
@@ -42,7 +72,20 @@ async def handle_barge_in(decoded, twilio_ws, streamsid): # function to handle t
 
 def execute_function_call(func_name, arguments):
     if func_name in FUNCTION_MAP:
-        result = FUNCTION_MAP[func_name](**arguments)
+        try:
+            result = FUNCTION_MAP[func_name](**arguments)
+        except Exception as e:
+            detail = conflict_detail(e)
+            if detail is not None:
+                # the bank refused (already decided / payee frozen): tell the agent why
+                result = {"error": detail or "conflict"}
+                if detail == "payee frozen":
+                    result["fallback"] = "schedule_fraud_specialist"
+            elif isinstance(e, CircuitOpenError) or is_retryable(e):
+                # breaker open, or retries used up: steer the agent to the specialist path
+                result = {"error": str(e), "fallback": "schedule_fraud_specialist"}
+            else:
+                raise
         print(f"Function call result: {result}")
         return result
     else:
@@ -76,7 +119,7 @@ async def handle_function_call_request(decoded, sts_ws): # function to handle th
             except Exception:
                 pass
 
-            result = execute_function_call(func_name, arguments)
+            result = await asyncio.to_thread(execute_function_call, func_name, arguments) # bank tools block (retries + backoff)
 
             function_result = create_function_call_response(func_id, func_name, result)
             await sts_ws.send(json.dumps(function_result))
@@ -175,13 +218,108 @@ async def twilio_receiver(twilio_ws, audio_queue, usertext_queue, streamsid_queu
         except:
             break 
 
+async def speak(twilio_ws, streamsid, segments): # render (fixed prompts from cache) and play an utterance; returns its duration in seconds
+    audio = await asyncio.to_thread(get_cache().speak, segments)
+    await stream_to_twilio(twilio_ws, streamsid, audio)
+    return len(audio) / SAMPLE_RATE
+
+async def fastpath_receiver(stt_ws, twilio_ws, streamsid, fastpath): # answer scripted turns locally from final transcripts
+    parts = []
+    async for message in stt_ws:
+        if type(message) is not str:
+            continue
+        decoded = json.loads(message)
+        if decoded.get("type") != "Results":
+            continue
+        text = decoded["channel"]["alternatives"][0].get("transcript", "")
+        if decoded.get("is_final") and text:
+            parts.append(text)
+        if not decoded.get("speech_final") or not parts:
+            continue
+        utterance, parts = " ".join(parts), []
+
+        try:
+            log_event(streamsid, "user_text", utterance)
+        except Exception:
+            pass
+        reply = await asyncio.to_thread(fastpath.on_transcript, utterance) # bank tools are blocking
+        duration = 0.0
+        if reply:
+            try:
+                log_event(streamsid, "fastpath_say", reply)
+            except Exception:
+                pass
+            duration = await speak(twilio_ws, streamsid, [reply])
+        if fastpath.done or fastpath.handed_off:
+            return duration
+
+async def hybrid_handler(twilio_ws): # VeriWire hybrid: local fast path first, Deepgram Agent only after hand-off
+    audio_queue = asyncio.Queue()
+    usertext_queue = asyncio.Queue()
+    streamsid_queue = asyncio.Queue()
+    receiver = asyncio.ensure_future(twilio_receiver(twilio_ws, audio_queue, usertext_queue, streamsid_queue))
+
+    streamsid = await streamsid_queue.get()
+    streamsid_queue.put_nowait(streamsid) # sts_receiver reads it again after hand-off
+    st = SESSIONS.get(streamsid)
+    phrase = st.get("phrase") or make_phrase()
+    SESSIONS.set(streamsid, {"phrase": phrase})
+    fastpath = FastPath(phrase, payment_id=st.get("payment_id"))
+
+    async with stt_connect() as stt_ws:
+        await speak(twilio_ws, streamsid, greeting_segments(phrase))
+        sender = asyncio.ensure_future(sts_sender(stt_ws, audio_queue, usertext_queue)) # same audio relay, STT-only endpoint
+        local = asyncio.ensure_future(fastpath_receiver(stt_ws, twilio_ws, streamsid, fastpath))
+        await asyncio.wait([local, receiver], return_when=asyncio.FIRST_COMPLETED)
+        sender.cancel()
+        local.cancel()
+    closing = None
+    if local.done() and not local.cancelled():
+        if local.exception() is not None:
+            # never leave the caller in silence: anything the fast path could not handle goes to the LLM
+            print(f"fast path failed: {local.exception()!r}")
+            fastpath.hand_off()
+        else:
+            closing = local.result()
+
+    try:
+        log_event(streamsid, "fastpath_end", json.dumps({"turns": fastpath.turns, "stage": fastpath.stage}))
+    except Exception:
+        pass
+
+    if fastpath.handed_off and not receiver.done():
+        async with sts_connect() as sts_ws:
+            config_message = load_config()
+            config_message["agent"].pop("greeting", None)
+            config_message["agent"]["think"]["prompt"] += (
+                f" The caller has already been greeted and asked to say exactly '{fastpath.state['phrase']}'. "
+                + fastpath.handoff_context()
+            )
+            await sts_ws.send(json.dumps(config_message))
+            await asyncio.wait(
+                [
+                    asyncio.ensure_future(sts_sender(sts_ws, audio_queue, usertext_queue)),
+                    asyncio.ensure_future(sts_receiver(sts_ws, twilio_ws, streamsid_queue)),
+                    receiver,
+                ]
+            )
+    elif not receiver.done():
+        # let the closing line play out before hanging up
+        await asyncio.wait([receiver], timeout=(closing or 0.0) + 1.0)
+
+    await twilio_ws.close()
+
 async def twilio_handler(twilio_ws): # VeriWire: handle the Twilio connection and Deepgram Agent
+    if HYBRID:
+        return await hybrid_handler(twilio_ws)
+
     audio_queue = asyncio.Queue() # create a queue to store the audio data streamed from Aura to Twilio - stores audio data for transcription 
     usertext_queue = asyncio.Queue() # queue for textual user inputs (e.g., DTMF)
     streamsid_queue = asyncio.Queue() # create a queue to store the streamsid data streamed from Twilio to Aura - represents current active connection to the WebSocket server
 
     async with sts_connect() as sts_ws: # connect to the WebSocket server to communicate with the Deepgram API
         config_message = load_config() # load the config data from the config.json file
+        greeting_audio = None
         # inject dynamic liveness greeting per session if available
         try:
             # wait briefly for streamsid to be available
@@ -191,14 +329,21 @@ async def twilio_handler(twilio_ws): # VeriWire: handle the Twilio connection an
             phrase = st.get("phrase") or make_phrase()
             SESSIONS.set(streamsid, {"phrase": phrase})
             if isinstance(config_message, dict) and "agent" in config_message:
-                config_message["agent"]["greeting"] = (
-                    f"Hello, this is VeriWire. For verification, please say exactly: '{phrase}'. "
-                    "For example: 'blue cedar 37' or 'silver harbor 42'."
-                )
+                greeting_audio = get_cache().lookup_segments(greeting_segments(phrase))
+                if greeting_audio is not None:
+                    # pre-rendered greeting goes straight to Twilio; the agent just needs the phrase
+                    config_message["agent"].pop("greeting", None)
+                    config_message["agent"]["think"]["prompt"] += (
+                        f" The caller has already been greeted and asked to say exactly '{phrase}'."
+                    )
+                else:
+                    config_message["agent"]["greeting"] = greeting_text(phrase)
         except Exception:
             pass
 
         await sts_ws.send(json.dumps(config_message)) # configure the Deepgram Agent
+        if greeting_audio is not None:
+            await stream_to_twilio(twilio_ws, streamsid, greeting_audio) # play cached greeting without a TTS round-trip
 
         await asyncio.wait(
             [
@@ -211,9 +356,9 @@ async def twilio_handler(twilio_ws): # VeriWire: handle the Twilio connection an
         await twilio_ws.close()
 
 async def main():
-    init_db()
-    await websockets.serve(twilio_handler, "localhost", 5000)
-    print("Server is running on http://localhost:5000")
+    await websockets.serve(twilio_handler, "localhost", PORT) # bind first so the instance can accept calls right away
+    print(f"Server is running on http://localhost:{PORT}")
+    asyncio.get_running_loop().run_in_executor(None, warm_up)
     await asyncio.Future()
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+import base64
+
+from veriwire import prompts
+from veriwire.audio_cache import AudioCache, FakeTTS, media_frames, warmup_texts
+
+
+def test_render_caches_in_memory_and_on_disk(tmp_path):
+    tts = FakeTTS()
+    cache = AudioCache(tmp_path, tts=tts)
+    audio = cache.render(prompts.REPROMPT_DECISION)
+    assert cache.render(prompts.REPROMPT_DECISION) == audio
+    assert tts.calls == 1
+    assert cache.stats.memory_hits == 1
+
+    # a fresh process reads the disk store without calling TTS
+    cold = AudioCache(tmp_path, tts=tts)
+    assert cold.get(prompts.REPROMPT_DECISION) == audio
+    assert cold.stats.disk_hits == 1 and tts.calls == 1
+
+
+def test_key_depends_on_voice(tmp_path):
+    a = AudioCache(tmp_path, tts=FakeTTS(voice="a"))
+    b = AudioCache(tmp_path, tts=FakeTTS(voice="b"))
+    assert a.key("hi") != b.key("hi")
+
+
+def test_memory_tier_is_lru_bounded(tmp_path):
+    size = len(FakeTTS().synthesize("first prompt"))
+    cache = AudioCache(tmp_path, tts=FakeTTS(), memory_bytes=2 * size + size // 2)
+    cache.render("first prompt")
+    cache.render("second prompt")
+    cache.render("third prompt")
+    assert len(cache._memory) == 2
+    assert cache.get("first prompt") is not None  # still on disk
+    assert cache.stats.disk_hits == 1
+
+
+def test_greeting_only_served_when_all_segments_cached(tmp_path):
+    cache = AudioCache(tmp_path, tts=FakeTTS())
+    cache.warm(warmup_texts())
+    segments = prompts.greeting_segments("blue cedar 37")
+    assert cache.lookup_segments(segments) is None
+    cache.warm([segments[1]])
+    assert cache.lookup_segments(segments) is not None
+
+
+def test_partial_lookup_counts_as_one_miss(tmp_path):
+    cache = AudioCache(tmp_path, tts=FakeTTS())
+    cache.warm(warmup_texts())
+    assert cache.lookup_segments(prompts.greeting_segments("blue cedar 37")) is None
+    assert cache.stats.misses == 1 and cache.stats.hits == 0
+    assert cache.stats.hit_rate() == 0.0
+
+    cache.warm(["'blue cedar 37'."])
+    assert cache.lookup_segments(prompts.greeting_segments("blue cedar 37")) is not None
+    assert cache.stats.hits == 1 and cache.stats.hit_rate() == 0.5
+
+
+def test_speak_keeps_one_off_lines_out_of_the_store(tmp_path):
+    tts = FakeTTS()
+    cache = AudioCache(tmp_path, tts=tts)
+    cache.speak(["Approved. Confirmation 10sf917264. Goodbye."])
+    assert not list(tmp_path.rglob("*.ulaw"))
+    assert cache.stats.hits == cache.stats.misses == 0
+    cache.speak([prompts.ASK_PHONE, "'blue cedar 37'."])
+    assert len(list(tmp_path.rglob("*.ulaw"))) == 2
+    assert tts.calls == 3
+
+
+def test_media_frames_are_20ms():
+    frames = media_frames("SID", b"\xff" * 400)
+    assert [len(base64.b64decode(f["media"]["payload"])) for f in frames] == [160, 160, 80]
+    assert frames[0]["streamSid"] == "SID"
@@ -26,3 +26,9 @@ def test_cancel_then_conflict():
     assert p2.status == "CANCELED"
 
 
+def test_pending_payments_dedupes_aliases():
+    db = BankDB()
+    ids = sorted(p.id for p in db.pending_payments())
+    assert ids == ["09ne482130", "10ny331842", "10sf917264"]
+    db.cancel("10sf917264")
+    assert "10sf917264" not in {p.id for p in db.pending_payments()}
@@ -1,10 +1,20 @@
+import pytest
 from fastapi.testclient import TestClient
 from api.bank_sandbox import app
+from veriwire import payee_registry
+from veriwire.bank_data import DB, Payment
 
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def registry(tmp_path, monkeypatch):
+    reg = payee_registry.FrozenPayeeRegistry(str(tmp_path / "frozen.db"))
+    monkeypatch.setattr(payee_registry, "_REGISTRY", reg)
+    return reg
+
+
 def test_get_payment_ok():
     r = client.get("/payments/10SF917264")
     assert r.status_code == 200
@@ -26,3 +36,31 @@ def test_cancel_then_conflict():
     assert r.status_code in (200, 409)
 
 
+def test_idempotency_key_replays_decision():
+    headers = {"Idempotency-Key": "test-key-1"}
+    first = client.post("/payments/10NY331842/approve", headers=headers)
+    assert first.status_code == 200
+    # a retry with the same key replays instead of hitting 409
+    again = client.post("/payments/10NY331842/approve", headers=headers)
+    assert again.status_code == 200
+    assert again.json() == first.json()
+    other = client.post("/payments/10NY331842/cancel")
+    assert other.status_code == 409
+
+
+def test_resolve_payment_ranks_misheard_id():
+    r = client.get("/resolve_payment", params={"q": "10xf917264"})
+    assert r.status_code == 200
+    assert r.json()["candidates"][0]["id"] == "10sf917264"
+
+
+def test_frozen_payee_blocks_approve():
+    r = client.post("/freeze_payee", params={"payee": "ACME Escrow, L.L.C."})
+    assert r.status_code == 200 and r.json()["ticket_id"].startswith("TKT-")
+    DB.add_payment(Payment(id="frz0000001", customer_phone="+14155550123", card_last4="1111",
+                           payee="ACME Escrow LLC", amount_cents=100))
+    r = client.post("/payments/frz0000001/approve")
+    assert r.status_code == 409
+    assert r.json()["detail"] == "payee frozen"
+    assert DB.get_payment("frz0000001").status == "PENDING"
+    assert client.post("/payments/frz0000001/cancel").status_code == 200
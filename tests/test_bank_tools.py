@@ -1,3 +1,4 @@
+from veriwire import bank_tools
 from veriwire.bank_tools import _normalize_pid
 
 
@@ -6,3 +7,31 @@ def test_normalize_pid_lower_and_strip():
     assert _normalize_pid(" wire2025  ") == "wire2025"
 
 
+
+
+class _ResolveTransport:
+    def __init__(self, candidates):
+        self.candidates = candidates
+        self.params = None
+
+    def request(self, method, path, params=None, headers=None):
+        self.params = params
+        return {"ok": True, "candidates": self.candidates[:int(params.get("limit", 3))]}
+
+
+def test_unconstrained_resolve_returns_one_unambiguous_candidate(monkeypatch):
+    t = _ResolveTransport([{"id": "10sf917264", "cost": 0.3}, {"id": "10sf917265", "cost": 1.0}])
+    monkeypatch.setattr(bank_tools, "_transport", t)
+    result = bank_tools.resolve_payment_id("10xf917264")
+    assert result["candidates"] == [{"id": "10sf917264", "cost": 0.3}]
+    assert result["confirm_with_caller"]
+
+    t.candidates = [{"id": "10sf917264", "cost": 1.0}, {"id": "10sf917265", "cost": 1.0}]
+    assert bank_tools.resolve_payment_id("10sf91726")["candidates"] == []
+
+
+def test_phone_constrained_resolve_returns_ranked_list(monkeypatch):
+    t = _ResolveTransport([{"id": "10sf917264", "cost": 0.3}, {"id": "10sf917265", "cost": 1.0}])
+    monkeypatch.setattr(bank_tools, "_transport", t)
+    assert len(bank_tools.resolve_payment_id("10xf917264", "+14155550123")["candidates"]) == 2
+    assert t.params["phone"] == "+14155550123"
@@ -0,0 +1,98 @@
+import asyncio
+import random
+
+import pytest
+
+from veriwire.bank_data import BankDB, Payment
+from veriwire.campaign import CampaignScheduler, FakeDialer
+
+
+class ScriptedDialer:
+    def __init__(self, outcomes=None, delay=0.01):
+        self.outcomes = outcomes or {}
+        self.delay = delay
+        self.order = []
+        self.active = {}
+        self.peak_per_phone = 0
+        self.peak = 0
+
+    async def dial(self, payment):
+        self.order.append(payment.id)
+        phone = payment.customer_phone
+        self.active[phone] = self.active.get(phone, 0) + 1
+        self.peak_per_phone = max(self.peak_per_phone, self.active[phone])
+        self.peak = max(self.peak, sum(self.active.values()))
+        await asyncio.sleep(self.delay)
+        self.active[phone] -= 1
+        script = self.outcomes.get(payment.id)
+        return script.pop(0) if script else "confirmed"
+
+
+def _db_with(n, phones=3):
+    db = BankDB()
+    for i in range(n):
+        db.add_payment(Payment(
+            id=f"cp{i:04d}", customer_phone=f"+1415555{i % phones:04d}", card_last4="0000",
+            payee="Payee", amount_cents=1000 * (i + 1), created_at=f"2025-01-01T00:00:{i % 60:02d}",
+        ))
+    return db
+
+
+def test_orders_by_amount_and_skips_decided():
+    db = BankDB()
+    db.cancel("09ne482130")
+    dialer = ScriptedDialer()
+    sched = CampaignScheduler(dialer, db=db, max_concurrent=1)
+    sched.load()
+    db.approve("10ny331842")  # decided after queueing -> status short-circuit
+    stats = asyncio.run(sched.run())
+    assert dialer.order == ["10sf917264"]
+    assert stats.skipped == 1 and stats.confirmed == 1
+
+
+def test_respects_global_and_per_customer_limits():
+    db = _db_with(30, phones=30)
+    dialer = ScriptedDialer()
+    sched = CampaignScheduler(dialer, db=db, max_concurrent=5, per_customer=1)
+    sched.load()
+    asyncio.run(sched.run())
+    assert dialer.peak == 5
+
+    db = _db_with(30, phones=3)
+    dialer = ScriptedDialer()
+    sched = CampaignScheduler(dialer, db=db, max_concurrent=10, per_customer=1)
+    sched.load()
+    asyncio.run(sched.run())
+    assert dialer.peak_per_phone == 1
+    assert dialer.peak <= 5  # 3 synthetic phones + 2 seeded demo phones
+
+
+@pytest.mark.parametrize("limits", [{"max_concurrent": 0}, {"per_customer": 0}, {"max_attempts": 0}])
+def test_rejects_limits_below_one(limits):
+    with pytest.raises(ValueError):
+        CampaignScheduler(FakeDialer(), db=BankDB(), **limits)
+
+
+def test_retries_no_answer_with_backoff_then_gives_up():
+    db = BankDB()
+    dialer = ScriptedDialer(outcomes={
+        "10sf917264": ["no_answer", "confirmed"],
+        "09ne482130": ["no_answer"] * 5,
+    })
+    sched = CampaignScheduler(dialer, db=db, max_attempts=3, retry_base=0.01)
+    sched.load()
+    stats = asyncio.run(sched.run())
+    assert dialer.order.count("09ne482130") == 3
+    assert stats.unreachable == 1
+    assert stats.confirmed == 2
+
+
+def test_fake_dialer_decides_wires():
+    db = _db_with(20, phones=10)
+    dialer = FakeDialer(db=db, answer_rate=1.0, ring_time=0, talk_time=0, rng=random.Random(1))
+    sched = CampaignScheduler(dialer, db=db, max_concurrent=4)
+    sched.load()
+    stats = asyncio.run(sched.run())
+    assert stats.confirmed == 23
+    assert not db.pending_payments()
+    assert stats.confirmations_per_hour() > 0
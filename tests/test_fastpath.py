@@ -0,0 +1,176 @@
+import json
+
+import pytest
+import requests
+
+from veriwire import fastpath, graph, prompts
+from veriwire.bank_data import BankDB
+from veriwire.dfdetect import DeepfakeDetector
+from veriwire.fastpath import FastPath, _spoken_payment_id
+
+SUMMARY = {
+    "id": "10sf917264", "payee": "ACME Escrow LLC", "amount_readable": "$9,700.00 USD",
+    "status": "PENDING", "card_last4": "1111", "customer_phone": "+14155550123",
+}
+
+
+@pytest.fixture
+def bank(monkeypatch):
+    calls = []
+
+    def summary(pid):
+        if pid != "10sf917264":
+            resp = requests.Response()
+            resp.status_code = 404
+            raise requests.HTTPError(response=resp)
+        return dict(SUMMARY)
+
+    monkeypatch.setattr(graph, "get_payment_summary", summary)
+    monkeypatch.setattr(graph, "approve_wire", lambda pid: calls.append(("approve", pid)) or {"id": pid})
+    monkeypatch.setattr(graph, "cancel_wire", lambda pid: calls.append(("cancel", pid)) or {"id": pid})
+    db = BankDB()
+    monkeypatch.setattr(fastpath, "resolve_payment_id", lambda heard: {
+        "candidates": [{"id": pid, "cost": cost} for pid, cost in db.resolve_payment_id(heard)]
+    })
+    return calls
+
+
+def _call(payment_id=None):
+    fp = FastPath("blue cedar 37", payment_id=payment_id)
+    fp.state["_df"] = DeepfakeDetector(threshold=2.0)
+    return fp
+
+
+def test_full_scripted_call_decides_locally(bank):
+    fp = _call()
+    assert fp.on_transcript("Blue cedar 37.") == prompts.ASK_PAYMENT_ID
+    assert fp.on_transcript("It's 10 SF 917264") == prompts.ASK_CARD_LAST4
+    assert fp.on_transcript("one one one one") == prompts.ASK_PHONE
+    assert fp.on_transcript("415 555 0123") == prompts.DECISION_READ_BACK.format(
+        amount="$9,700.00 USD", payee="ACME Escrow LLC")
+    assert fp.on_transcript("approve") == "Approved. Confirmation 10sf917264. Goodbye."
+    assert fp.done and not fp.handed_off
+    assert fp.turns == 5
+    assert bank == [("approve", "10sf917264")]
+
+
+def test_known_payment_skips_id_prompt(bank):
+    fp = _call(payment_id="10SF917264")
+    assert fp.on_transcript("blue cedar 37") == prompts.ASK_CARD_LAST4
+
+
+def test_free_form_hands_off_with_context(bank):
+    fp = _call(payment_id="10sf917264")
+    fp.on_transcript("blue cedar 37")
+    fp.on_transcript("1111")
+    assert fp.on_transcript("Why are you calling me?") is None
+    assert fp.handed_off
+    ctx = fp.handoff_context()
+    assert "liveness passed" in ctx and "card last-4 verified" in ctx
+    assert "phone verified" not in ctx
+    assert "0123" not in ctx
+
+
+def test_repeated_misses_hand_off(bank):
+    fp = _call()
+    fp.on_transcript("blue cedar 37")
+    assert fp.on_transcript("99zz000000") == prompts.REPROMPT_PAYMENT_ID
+    assert fp.on_transcript("99zz000001") == prompts.REPROMPT_PAYMENT_ID
+    assert fp.on_transcript("99zz000002") is None
+    assert fp.handed_off
+
+
+def test_misheard_id_confirmed_before_use(bank):
+    fp = _call()
+    fp.on_transcript("blue cedar 37")
+    # "ten ess eff" heard as "10 x f"
+    confirm = prompts.CONFIRM_PAYMENT_ID.format(spelled="1 0 S F 9 1 7 2 6 4")
+    assert fp.on_transcript("10 x f 917264") == confirm
+    assert "payment_id" not in fp.state
+    assert fp.on_transcript("yes, that's it") == prompts.ASK_CARD_LAST4
+    assert fp.state["payment_id"] == "10sf917264"
+
+
+def test_rejected_candidate_asks_again(bank):
+    fp = _call()
+    fp.on_transcript("blue cedar 37")
+    fp.on_transcript("10 x f 917264")
+    assert fp.on_transcript("no") == prompts.REPROMPT_PAYMENT_ID
+    assert fp.stage == "payment_id" and "payment_id" not in fp.state
+
+
+def _http_error(status, detail=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = json.dumps({"detail": detail}).encode()
+    return requests.HTTPError(response=resp)
+
+
+def _at_decision(payment_id="10sf917264"):
+    fp = _call(payment_id=payment_id)
+    fp.on_transcript("blue cedar 37")
+    fp.on_transcript("1111")
+    fp.on_transcript("415 555 0123")
+    return fp
+
+
+@pytest.mark.parametrize("said", [
+    "Don't approve it, cancel it.",
+    "No, I did not approve this. Cancel.",
+    "I never approved this",
+    "uh, yes",
+])
+def test_only_a_bare_decision_moves_money(bank, said):
+    fp = _at_decision()
+    assert fp.on_transcript(said) is None
+    assert fp.handed_off and not fp.done
+    assert bank == []
+
+
+def test_bare_cancel_decides_locally(bank):
+    fp = _at_decision()
+    assert fp.on_transcript("Cancel.") == "Canceled. Ticket 10sf917264. Goodbye."
+    assert bank == [("cancel", "10sf917264")]
+
+
+def test_approve_on_frozen_payee_transfers(bank, monkeypatch):
+    def frozen(pid):
+        raise _http_error(409, "payee frozen")
+
+    escalated = []
+    monkeypatch.setattr(graph, "approve_wire", frozen)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", escalated.append)
+    fp = _at_decision()
+    assert fp.on_transcript("approve") == prompts.PAYEE_FROZEN
+    assert fp.done and escalated == ["+14155550123"]
+
+
+def test_approve_on_already_decided_hands_off(bank, monkeypatch):
+    def decided(pid):
+        raise _http_error(409, "already CANCELED")
+
+    monkeypatch.setattr(graph, "approve_wire", decided)
+    fp = _at_decision()
+    assert fp.on_transcript("approve") == prompts.ALREADY_DECIDED.format(status="CANCELED")
+    assert fp.handed_off
+
+
+def test_bank_errors_never_escape(bank, monkeypatch):
+    def down(*args):
+        raise requests.ConnectionError("bank unreachable")
+
+    monkeypatch.setattr(graph, "approve_wire", down)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", down)
+    fp = _at_decision()
+    assert fp.on_transcript("approve") == prompts.BANK_UNAVAILABLE
+    assert fp.done
+
+    monkeypatch.setattr(graph, "get_payment_summary", lambda pid: (_ for _ in ()).throw(_http_error(503)))
+    fp = _call(payment_id="10sf917264")
+    assert fp.on_transcript("blue cedar 37") is None
+    assert fp.handed_off
+
+
+def test_spoken_payment_id():
+    assert _spoken_payment_id("my id is one zero s f 9 1 7 2 6 4") == "10sf917264"
+    assert _spoken_payment_id("10SF917264.") == "10sf917264"
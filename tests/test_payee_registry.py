@@ -0,0 +1,83 @@
+import requests
+
+from veriwire import graph, prompts
+from veriwire.payee_registry import BloomFilter, FrozenPayeeRegistry, normalize_payee
+
+
+def test_normalize_payee_variants():
+    key = normalize_payee("ACME Escrow LLC")
+    assert normalize_payee("acme escrow, l.l.c.") == key
+    assert normalize_payee("  Acme  Escrow Inc. ") == key
+    assert normalize_payee("ACME-Escrow") == key
+    assert normalize_payee("Metro Equip Suppliers Inc") == "metro equip suppliers"
+    assert normalize_payee("LLC") == "llc"
+
+
+def test_freeze_and_lookup_persist(tmp_path):
+    path = str(tmp_path / "frozen.db")
+    reg = FrozenPayeeRegistry(path)
+    first = reg.freeze("ACME Escrow LLC")
+    again = reg.freeze("Acme Escrow, Inc.")
+    assert again["ticket_id"] == first["ticket_id"]
+    assert len(reg) == 1
+    assert reg.is_frozen("acme escrow")
+    assert not reg.is_frozen("NorthEast Home Title LLC")
+    reg.close()
+
+    reopened = FrozenPayeeRegistry(path)
+    assert reopened.is_frozen("ACME ESCROW LLC")
+
+
+def test_runtime_freeze_reopens_without_rescan(tmp_path, monkeypatch):
+    path = str(tmp_path / "frozen.db")
+    reg = FrozenPayeeRegistry(path)
+    reg.bulk_import(f"Shell Company {i} LLC" for i in range(200))
+    reg.freeze("ACME Escrow LLC")  # the sandbox never calls close()
+
+    def no_rescan(self, capacity):
+        raise AssertionError("bloom rebuilt from the table")
+
+    monkeypatch.setattr(FrozenPayeeRegistry, "_rebuild", no_rescan)
+    reopened = FrozenPayeeRegistry(path)
+    assert len(reopened) == 201
+    assert reopened.is_frozen("acme escrow") and reopened.is_frozen("shell company 7")
+
+
+def test_bulk_import_grows_bloom(tmp_path):
+    reg = FrozenPayeeRegistry(str(tmp_path / "frozen.db"), capacity=10)
+    added = reg.bulk_import(f"Shell Company {i} LLC" for i in range(500))
+    assert added == 500 and len(reg) == 500
+    assert reg._bloom.capacity >= 500
+    assert reg.is_frozen("shell company 499")
+    assert not reg.is_frozen("shell company 500")
+
+
+def test_bloom_false_positive_rate():
+    bloom = BloomFilter(10_000, fp_rate=0.01)
+    for i in range(10_000):
+        bloom.add(f"in-{i}")
+    assert all(f"in-{i}" in bloom for i in range(10_000))
+    fp = sum(f"out-{i}" in bloom for i in range(10_000))
+    assert fp < 300
+
+
+def _frozen(*args, **kwargs):
+    resp = requests.Response()
+    resp.status_code = 409
+    resp._content = b'{"detail": "payee frozen"}'
+    raise requests.HTTPError("409 Client Error", response=resp)
+
+
+def test_frozen_payee_is_explained_on_llm_and_graph_paths(monkeypatch):
+    import main
+
+    monkeypatch.setitem(main.FUNCTION_MAP, "approve_wire", _frozen)
+    assert main.execute_function_call("approve_wire", {"payment_id": "10sf917264"}) == {
+        "error": "payee frozen", "fallback": "schedule_fraud_specialist"}
+
+    escalated = []
+    monkeypatch.setattr(graph, "approve_wire", _frozen)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", escalated.append)
+    state = {"payment_id": "10sf917264", "customer_phone": "+14155550123", "intent": "approve"}
+    assert graph.act(state)["say"] == prompts.PAYEE_FROZEN
+    assert escalated == ["+14155550123"]
@@ -0,0 +1,39 @@
+from veriwire.pid_index import PaymentIdIndex, confusion_key, weighted_distance
+
+
+def _index():
+    idx = PaymentIdIndex()
+    idx.add("10sf917264", "+14155550123")
+    idx.add("09ne482130", "+14155550123")
+    idx.add("10ny331842", "+13475550199")
+    return idx
+
+
+def test_exact_and_confusable_substitutions():
+    idx = _index()
+    assert idx.resolve("10SF-917264")[0] == ("10sf917264", 0.0)
+    # s->f, f->s, 9->5 all within confusion classes
+    top, cost = idx.resolve("10fs517264")[0]
+    assert top == "10sf917264"
+    assert cost < 1.0
+
+
+def test_single_arbitrary_edit():
+    idx = _index()
+    assert idx.resolve("10sf91764")[0][0] == "10sf917264"   # dropped character
+    assert idx.resolve("10sf917r64")[0][0] == "10sf917264"  # non-confusable swap
+
+
+def test_phone_constraint_limits_candidates():
+    idx = _index()
+    assert idx.resolve("10ny331842", phone="(415) 555-0123") == []
+    assert idx.resolve("10ny331843", phone="+1 347 555 0199")[0][0] == "10ny331842"
+
+
+def test_far_ids_are_not_returned():
+    assert _index().resolve("zzzzzzzzzz") == []
+
+
+def test_confusion_key_and_distance():
+    assert confusion_key("b3d") == confusion_key("ddd")
+    assert weighted_distance("10sf", "10sx") < weighted_distance("10sf", "10sr")
@@ -0,0 +1,137 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from veriwire import graph, prompts
+from veriwire.resilience import CircuitBreaker, CircuitOpenError, Endpoint, LatencyTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _http_error(status):
+    resp = requests.Response()
+    resp.status_code = status
+    return requests.HTTPError(response=resp)
+
+
+def test_breaker_opens_then_half_open_probe_closes():
+    clock = FakeClock()
+    br = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=clock)
+    br.record_failure()
+    br.record_failure()
+    assert br.state == "open" and not br.allow()
+    clock.now = 5
+    assert br.allow()          # single probe
+    assert not br.allow()
+    br.record_success()
+    assert br.state == "closed"
+
+
+def test_open_breaker_fails_fast():
+    ep = Endpoint("x", breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(requests.ConnectionError):
+        ep.call(lambda: (_ for _ in ()).throw(requests.ConnectionError()))
+    with pytest.raises(CircuitOpenError):
+        ep.call(lambda: "never")
+
+
+def test_retried_retries_transient_but_not_conflict():
+    ep = Endpoint("approve", sleep=lambda s: None)
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _http_error(503)
+        return "ok"
+
+    assert ep.retried(flaky) == "ok"
+    assert len(calls) == 3
+
+    def conflict():
+        calls.append(1)
+        raise _http_error(409)
+
+    calls.clear()
+    with pytest.raises(requests.HTTPError):
+        ep.retried(conflict)
+    assert len(calls) == 1
+    assert ep.breaker.state == "closed"
+
+
+def test_hedged_read_beats_slow_primary():
+    tracker = LatencyTracker(default_delay=0.02)
+    ep = Endpoint("get_payment", tracker=tracker)
+    first = threading.Event()
+
+    def read():
+        if not first.is_set():
+            first.set()
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    start = time.perf_counter()
+    assert ep.hedged(read) == "fast"
+    assert time.perf_counter() - start < 0.4
+
+
+def test_hedge_delay_tracks_p95():
+    tracker = LatencyTracker(min_samples=5, default_delay=1.0)
+    assert tracker.hedge_delay() == 1.0
+    for ms in range(1, 21):
+        tracker.record(ms / 1000)
+    assert tracker.hedge_delay() == pytest.approx(0.020)
+
+
+def _unreachable(*args):
+    raise requests.ConnectionError("bank unreachable")
+
+
+def test_open_breaker_falls_back_even_if_specialist_unreachable(monkeypatch):
+    def open_breaker(pid):
+        raise CircuitOpenError("approve")
+
+    monkeypatch.setattr(graph, "approve_wire", open_breaker)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", _unreachable)
+    state = {"payment_id": "10sf917264", "customer_phone": "+14155550123", "intent": "approve"}
+    assert graph.act(state)["say"] == prompts.BANK_UNAVAILABLE
+
+
+def test_exhausted_retries_fall_back_like_open_breaker(monkeypatch):
+    def exhausted(pid):
+        raise _http_error(503)
+
+    monkeypatch.setattr(graph, "approve_wire", exhausted)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", lambda phone: {"ok": True})
+    state = {"payment_id": "10sf917264", "customer_phone": "+14155550123", "intent": "approve"}
+    assert graph.act(state)["say"] == prompts.BANK_UNAVAILABLE
+
+
+def test_saturated_endpoint_does_not_queue_reads():
+    ep = Endpoint("get_payment", tracker=LatencyTracker(default_delay=0.01), max_in_flight=2)
+    release = threading.Event()
+    stalled = [ep._spawn(lambda: release.wait(2)) for _ in range(2)]
+    try:
+        start = time.perf_counter()
+        assert ep.hedged(lambda: "fresh") == "fresh"
+        assert time.perf_counter() - start < 0.5
+    finally:
+        release.set()
+    assert all(f.result() for f in stalled)
+
+
+def test_deepfake_transfer_survives_bank_failures(monkeypatch):
+    monkeypatch.setattr(graph, "freeze_payee", _unreachable)
+    monkeypatch.setattr(graph, "schedule_fraud_specialist", _unreachable)
+    state = {"payment_id": "10sf917264", "customer_phone": "+14155550123", "df_flag": True,
+             "summary": {"payee": "ACME Escrow LLC"}}
+    assert graph.act(state)["say"] == prompts.TRANSFER_SPECIALIST
@@ -0,0 +1,20 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_bridge_import_defers_heavy_subsystems():
+    code = (
+        "import sys, main; "
+        "heavy = [m for m in ('langgraph', 'sqlalchemy') if m in sys.modules]; "
+        "assert not heavy, heavy"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_graph_app_still_importable():
+    from veriwire.graph import graph_app
+
+    assert hasattr(graph_app, "invoke")
@@ -1,3 +1,8 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from veriwire.storage import init_db, log_event, SessionLocal, Event
 
 
@@ -11,3 +16,14 @@ def test_log_event_creates_row():
         assert row.kind == "test"
 
 
+def test_log_event_before_init_db_creates_tables(tmp_path):
+    # a fresh instance may log a call's first events before warm-up has run
+    root = Path(__file__).resolve().parents[1]
+    code = (
+        "from veriwire.storage import log_event, SessionLocal, Event; "
+        "log_event('STREAM2', 'start', '{}'); "
+        "db = SessionLocal(); assert db.query(Event).count() == 1"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True,
+                   env={**os.environ, "PYTHONPATH": str(root)})
+    assert (tmp_path / "veriwire.db").exists()
@@ -0,0 +1,124 @@
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from veriwire import bank_tools, payee_registry
+from veriwire.bank_data import DB, Payment
+from veriwire.transport import HttpTransport, InProcessTransport, UnixSocketTransport, make_transport
+
+
+@pytest.fixture
+def inprocess(tmp_path, monkeypatch):
+    monkeypatch.setattr(payee_registry, "_REGISTRY",
+                        payee_registry.FrozenPayeeRegistry(str(tmp_path / "frozen.db")))
+    transport = InProcessTransport()
+    bank_tools.set_transport(transport)
+    yield transport
+    bank_tools.set_transport(None)
+
+
+def _pending(pid):
+    DB.add_payment(Payment(id=pid, customer_phone="+14155550123", card_last4="1111",
+                           payee="Transport Test LLC", amount_cents=123456))
+    return pid
+
+
+def test_inprocess_maps_404_and_409(inprocess):
+    with pytest.raises(requests.HTTPError) as exc:
+        inprocess.request("GET", "/payments/nope")
+    assert exc.value.response.status_code == 404
+
+    pid = _pending("tr00000001")
+    assert inprocess.request("POST", f"/payments/{pid}/cancel")["status"] == "CANCELED"
+    with pytest.raises(requests.HTTPError) as exc:
+        inprocess.request("POST", f"/payments/{pid}/approve")
+    assert exc.value.response.status_code == 409
+    assert exc.value.response.json() == {"detail": "already CANCELED"}
+
+
+def test_bank_tools_over_inprocess(inprocess):
+    pid = _pending("tr00000002")
+    summary = bank_tools.get_payment_summary(pid.upper())
+    assert summary["amount_readable"] == "$1,234.56 USD"
+    assert bank_tools.approve_wire(pid)["status"] == "APPROVED"
+    assert bank_tools.verify_last4(pid, "1111")["match"]
+    assert bank_tools.freeze_payee("Transport Test Inc")["ok"]
+    assert bank_tools.resolve_payment_id("tr0000000z", "+14155550123")["candidates"][0]["id"].startswith("tr")
+
+
+def test_make_transport_from_env(monkeypatch):
+    monkeypatch.setenv("VERIWIRE_BANK_TRANSPORT", "uds")
+    monkeypatch.setenv("VERIWIRE_BANK_SOCKET", "/tmp/x.sock")
+    t = make_transport()
+    assert isinstance(t, UnixSocketTransport) and t.path == "/tmp/x.sock"
+    assert isinstance(make_transport("http"), HttpTransport)
+    with pytest.raises(ValueError):
+        make_transport("carrier-pigeon")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status, body = (200, {"path": self.path}) if self.path.startswith("/ok") else (404, {"detail": "Not Found"})
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        sock, _ = super().get_request()
+        return sock, ("local", 0)
+
+
+def test_unix_socket_roundtrip_and_errors():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.sock")
+        server = _UnixHTTPServer(path, _Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            t = UnixSocketTransport(path)
+            assert t.request("GET", "/ok", params={"q": "a b"}) == {"path": "/ok?q=a+b"}
+            assert t.request("GET", "/ok/again")["path"] == "/ok/again"  # reused connection
+            with pytest.raises(requests.HTTPError) as exc:
+                t.request("GET", "/missing")
+            assert exc.value.response.status_code == 404
+        finally:
+            server.shutdown()
+            server.server_close()
+        with pytest.raises(requests.ConnectionError):
+            UnixSocketTransport(path).request("GET", "/ok")
+
+
+class _ShortKeepAliveHandler(_Handler):
+    timeout = 0.2  # server drops idle keep-alive sockets, like uvicorn's timeout_keep_alive
+
+
+def test_unix_socket_reconnects_after_server_keep_alive_expires():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bank.sock")
+        server = _UnixHTTPServer(path, _ShortKeepAliveHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            t = UnixSocketTransport(path)
+            assert t.request("GET", "/ok/1")["path"] == "/ok/1"
+            time.sleep(0.5)  # caller pauses between turns
+            assert t.request("GET", "/ok/2")["path"] == "/ok/2"
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,270 @@
+"""Pre-rendered 8 kHz mu-law audio for fixed and templated prompts.
+
+Warm the store once per voice, e.g.:
+
+    uv run python -m veriwire.audio_cache warmup --phrases
+"""
+import argparse
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import requests
+
+from veriwire import prompts
+
+SAMPLE_RATE = 8000
+FRAME_BYTES = 160  # 20 ms of 8 kHz mu-law, the size Twilio sends and expects
+DEFAULT_VOICE = "aura-2-thalia-en"
+
+
+class DeepgramTTS:
+    def __init__(self, voice: str = DEFAULT_VOICE, api_key: Optional[str] = None):
+        self.voice = voice
+        self.api_key = api_key or os.getenv("DEEPGRAM_API_KEY")
+
+    def synthesize(self, text: str) -> bytes:
+        if not self.api_key:
+            raise Exception("DEEPGRAM_API_KEY environment variable is not set")
+        r = requests.post(
+            "https://api.deepgram.com/v1/speak",
+            params={"model": self.voice, "encoding": "mulaw",
+                    "sample_rate": SAMPLE_RATE, "container": "none"},
+            headers={"Authorization": f"Token {self.api_key}"},
+            json={"text": text},
+            timeout=10,
+        )
+        r.raise_for_status()
+        return r.content
+
+
+class FakeTTS:
+    """Deterministic stand-in for tests/benchmarks: fixed latency, silence-ish audio."""
+
+    def __init__(self, latency: float = 0.0, voice: str = "fake"):
+        self.latency = latency
+        self.voice = voice
+        self.calls = 0
+
+    def synthesize(self, text: str) -> bytes:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        # ~60 ms of audio per character, filled with a byte derived from the text
+        fill = hashlib.sha256(text.encode()).digest()[:1]
+        return fill * (len(text) * SAMPLE_RATE * 60 // 1000)
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    syntheses: int = 0
+    synth_seconds: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def saved_seconds(self) -> float:
+        # every hit skips one TTS round-trip of the average observed cost
+        if not self.syntheses:
+            return 0.0
+        return self.hits * self.synth_seconds / self.syntheses
+
+
+class AudioCache:
+    def __init__(self, root: str = "audio_cache", tts=None, memory_bytes: int = 8 * 1024 * 1024):
+        self.root = Path(root)
+        self.tts = tts or DeepgramTTS()
+        self.memory_bytes = memory_bytes
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_used = 0
+        self._lock = threading.Lock()
+
+    def key(self, text: str) -> str:
+        # content-addressed: same voice/format/text -> same audio
+        ident = json.dumps([self.tts.voice, "mulaw", SAMPLE_RATE, text])
+        return hashlib.sha256(ident.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.ulaw"
+
+    def _remember(self, key: str, audio: bytes) -> None:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return
+            self._memory[key] = audio
+            self._memory_used += len(audio)
+            while self._memory_used > self.memory_bytes and len(self._memory) > 1:
+                _, old = self._memory.popitem(last=False)
+                self._memory_used -= len(old)
+
+    def _load(self, text: str):
+        # (audio, tier) without touching stats; tier is "memory", "disk" or None
+        key = self.key(text)
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                return audio, "memory"
+        path = self._path(key)
+        if path.exists():
+            audio = path.read_bytes()
+            self._remember(key, audio)
+            return audio, "disk"
+        return None, None
+
+    def _count(self, tier: Optional[str]) -> None:
+        with self._lock:
+            if tier == "memory":
+                self.stats.memory_hits += 1
+            elif tier == "disk":
+                self.stats.disk_hits += 1
+            else:
+                self.stats.misses += 1
+
+    def get(self, text: str) -> Optional[bytes]:
+        """Cached audio for text, or None. Never calls TTS."""
+        audio, tier = self._load(text)
+        self._count(tier)
+        return audio
+
+    def put(self, text: str, audio: bytes) -> None:
+        key = self.key(text)
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(audio)
+        tmp.replace(path)
+        self._remember(key, audio)
+
+    def render(self, text: str) -> bytes:
+        audio = self.get(text)
+        if audio is not None:
+            return audio
+        start = time.perf_counter()
+        audio = self.tts.synthesize(text)
+        self.stats.syntheses += 1
+        self.stats.synth_seconds += time.perf_counter() - start
+        self.put(text, audio)
+        return audio
+
+    def render_segments(self, segments: Iterable[str]) -> bytes:
+        return b"".join(self.render(s) for s in segments)
+
+    def speak(self, segments: Iterable[str]) -> bytes:
+        """Audio for an utterance; only fixed prompts and greeting pieces use the store.
+
+        One-off lines (confirmation numbers, spelled payment IDs, retry phrases)
+        are synthesized directly so they never land on disk or in the stats.
+        """
+        return b"".join(self.render(s) if is_cacheable(s) else self.tts.synthesize(s)
+                        for s in segments)
+
+    def lookup_segments(self, segments: Iterable[str]) -> Optional[bytes]:
+        """Concatenated audio only if every segment is already cached.
+
+        Counted as one lookup: a hit only when the whole utterance can be served.
+        """
+        parts, tier = [], "memory"
+        for s in segments:
+            audio, seg_tier = self._load(s)
+            if audio is None:
+                self._count(None)
+                return None
+            if seg_tier == "disk":
+                tier = "disk"
+            parts.append(audio)
+        self._count(tier)
+        return b"".join(parts)
+
+    def warm(self, texts: Iterable[str]) -> int:
+        rendered = 0
+        for text in texts:
+            if self._path(self.key(text)).exists():
+                continue
+            self.put(text, self.tts.synthesize(text))
+            rendered += 1
+        return rendered
+
+
+def media_frames(streamsid: str, audio: bytes, frame_bytes: int = FRAME_BYTES) -> List[dict]:
+    return [
+        {
+            "event": "media",
+            "streamSid": streamsid,
+            "media": {"payload": base64.b64encode(audio[i:i + frame_bytes]).decode("ascii")},
+        }
+        for i in range(0, len(audio), frame_bytes)
+    ]
+
+
+async def stream_to_twilio(twilio_ws, streamsid: str, audio: bytes) -> None:
+    for frame in media_frames(streamsid, audio):
+        await twilio_ws.send(json.dumps(frame))
+
+
+def warmup_texts(include_phrases: bool = False) -> List[str]:
+    texts = list(prompts.FIXED_PROMPTS)
+    if include_phrases:
+        texts += [prompts.greeting_segments(p)[1] for p in prompts.all_phrases()]
+    return texts
+
+
+_CACHEABLE: Optional[frozenset] = None
+
+
+def is_cacheable(text: str) -> bool:
+    global _CACHEABLE
+    if _CACHEABLE is None:
+        _CACHEABLE = frozenset(warmup_texts(include_phrases=True))
+    return text in _CACHEABLE
+
+
+_CACHE: Optional[AudioCache] = None
+
+
+def get_cache() -> AudioCache:
+    global _CACHE
+    if _CACHE is None:
+        _CACHE = AudioCache(os.getenv("VERIWIRE_AUDIO_CACHE", "audio_cache"))
+    return _CACHE
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m veriwire.audio_cache")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    warm = sub.add_parser("warmup", help="pre-render fixed prompts into the disk store")
+    warm.add_argument("--root", default=os.getenv("VERIWIRE_AUDIO_CACHE", "audio_cache"))
+    warm.add_argument("--voice", default=DEFAULT_VOICE)
+    warm.add_argument("--phrases", action="store_true", help="also render every liveness phrase")
+    warm.add_argument("--fake", action="store_true", help="use the offline TTS stand-in")
+    args = parser.parse_args(argv)
+
+    tts = FakeTTS() if args.fake else DeepgramTTS(voice=args.voice)
+    cache = AudioCache(args.root, tts=tts)
+    texts = warmup_texts(args.phrases)
+    rendered = cache.warm(texts)
+    print(f"{rendered} rendered, {len(texts) - rendered} already cached in {cache.root}")
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    main()
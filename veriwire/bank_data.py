@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, asdict
 from datetime import datetime, UTC
-from typing import Dict, Optional, Literal
+from typing import Dict, List, Optional, Literal, Tuple
+
+from veriwire.pid_index import PaymentIdIndex
 
 
 @dataclass
@@ -59,6 +61,9 @@ class BankDB:
         # Demo convenience aliases
         self._payments["pending_wire_id"] = self._payments["10sf917264"]
         self._payments["pending_payment"] = self._payments["10sf917264"]
+        self.pid_index = PaymentIdIndex()
+        for p in {p.id: p for p in self._payments.values()}.values():
+            self.pid_index.add(p.id, p.customer_phone)
 
     def seed(self) -> None:
         # No-op: preloaded with realistic entries above
@@ -67,6 +72,19 @@ class BankDB:
     def get_payment(self, pid: str) -> Optional[Payment]:
         return self._payments.get(pid)
 
+    def add_payment(self, p: Payment) -> None:
+        self._payments[p.id] = p
+        self.pid_index.add(p.id, p.customer_phone)
+
+    def resolve_payment_id(self, heard: str, phone: Optional[str] = None,
+                           limit: int = 3) -> List[Tuple[str, float]]:
+        return self.pid_index.resolve(heard, phone=phone, limit=limit)
+
+    def pending_payments(self) -> List[Payment]:
+        # aliases point at the same record; dedupe by canonical id
+        unique = {p.id: p for p in self._payments.values() if p.status == "PENDING"}
+        return list(unique.values())
+
     def approve(self, pid: str) -> Payment:
         p = self._require(pid)
         if p.status != "PENDING":
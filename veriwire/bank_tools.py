@@ -1,6 +1,28 @@
+import threading
+import uuid
+
 import requests
 
-BASE = "http://127.0.0.1:8000"
+from veriwire.resilience import endpoint
+from veriwire.transport import make_transport
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    # chosen by VERIWIRE_BANK_TRANSPORT (http / uds / inprocess) on first use
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = make_transport()
+        return _transport
+
+
+def set_transport(transport) -> None:
+    global _transport
+    with _transport_lock:
+        _transport = transport
 
 
 def _normalize_pid(payment_id: str) -> str:
@@ -14,11 +36,41 @@ def _require_pid(payment_id: str) -> str:
     return _normalize_pid(payment_id)
 
 
+def conflict_detail(exc: BaseException):
+    """The bank's 409 detail ("already APPROVED", "payee frozen", ...), else None."""
+    if not isinstance(exc, requests.HTTPError) or exc.response is None:
+        return None
+    if exc.response.status_code != 409:
+        return None
+    try:
+        return str(exc.response.json().get("detail", ""))
+    except ValueError:
+        return ""
+
+
+def _fetch_payment(pid: str):
+    # Reads are side-effect free, so a slow attempt is hedged with a second copy.
+    def fetch():
+        return get_transport().request("GET", f"/payments/{pid}")
+
+    return endpoint("get_payment").hedged(fetch)
+
+
+def _decide(pid: str, action: str):
+    # One key per decision: a retried approve/cancel replays instead of re-executing.
+    key = uuid.uuid4().hex
+
+    def send():
+        return get_transport().request(
+            "POST", f"/payments/{pid}/{action}", headers={"Idempotency-Key": key}
+        )
+
+    return endpoint(action).retried(send)
+
+
 def get_payment_summary(payment_id: str):
     pid = _require_pid(payment_id)
-    r = requests.get(f"{BASE}/payments/{pid}", timeout=5)
-    r.raise_for_status()
-    p = r.json()
+    p = _fetch_payment(pid)
     dollars = p["amount_cents"] / 100.0
     return {
         "id": p["id"],
@@ -33,30 +85,28 @@ def get_payment_summary(payment_id: str):
 
 def approve_wire(payment_id: str):
     pid = _require_pid(payment_id)
-    r = requests.post(f"{BASE}/payments/{pid}/approve", timeout=5)
-    r.raise_for_status()
-    return r.json()
+    return _decide(pid, "approve")
 
 
 def cancel_wire(payment_id: str):
     pid = _require_pid(payment_id)
-    r = requests.post(f"{BASE}/payments/{pid}/cancel", timeout=5)
-    r.raise_for_status()
-    return r.json()
+    return _decide(pid, "cancel")
 
 
 def freeze_payee(payee: str):
-    r = requests.post(f"{BASE}/freeze_payee", params={"payee": payee}, timeout=5)
-    r.raise_for_status()
-    return r.json()
+    def send():
+        return get_transport().request("POST", "/freeze_payee", params={"payee": payee})
+
+    return endpoint("freeze_payee").call(send)
 
 
 def schedule_fraud_specialist(customer_phone: str):
-    r = requests.post(
-        f"{BASE}/schedule_specialist", params={"phone": customer_phone}, timeout=5
-    )
-    r.raise_for_status()
-    return r.json()
+    def send():
+        return get_transport().request(
+            "POST", "/schedule_specialist", params={"phone": customer_phone}
+        )
+
+    return endpoint("schedule_specialist").call(send)
 
 
 FUNCTION_MAP = {
@@ -75,9 +125,7 @@ def _normalize_phone_digits(val: str) -> str:
 
 def verify_last4(payment_id: str, last4: str):
     pid = _require_pid(payment_id)
-    r = requests.get(f"{BASE}/payments/{pid}", timeout=5)
-    r.raise_for_status()
-    p = r.json()
+    p = _fetch_payment(pid)
     provided = "".join(ch for ch in last4 if ch.isdigit())
     match = (len(provided) == 4 and provided == p.get("card_last4", ""))
     return {"ok": True, "match": match}
@@ -85,9 +133,7 @@ def verify_last4(payment_id: str, last4: str):
 
 def verify_phone(payment_id: str, phone_digits: str):
     pid = _require_pid(payment_id)
-    r = requests.get(f"{BASE}/payments/{pid}", timeout=5)
-    r.raise_for_status()
-    p = r.json()
+    p = _fetch_payment(pid)
     expected = _normalize_phone_digits(p.get("customer_phone", ""))
     provided = _normalize_phone_digits(phone_digits)
     match = False
@@ -96,10 +142,33 @@ def verify_phone(payment_id: str, phone_digits: str):
     return {"ok": True, "match": match, "expected_len": len(expected)}
 
 
+def resolve_payment_id(spoken_id: str, customer_phone: str = ""):
+    # Ranked known IDs close to a possibly misheard one; phone narrows to that customer.
+    # Unconstrained matches may belong to other customers, so only an unambiguous best
+    # match comes back, and it must be confirmed by the caller before use.
+    params = {"q": spoken_id}
+    if customer_phone:
+        params["phone"] = customer_phone
+    else:
+        params["limit"] = 2
+
+    def fetch():
+        return get_transport().request("GET", "/resolve_payment", params=params)
+
+    result = endpoint("resolve_payment").hedged(fetch)
+    if customer_phone:
+        return result
+    candidates = result.get("candidates", [])
+    if len(candidates) > 1 and candidates[1]["cost"] <= candidates[0]["cost"]:
+        candidates = []
+    return {**result, "candidates": candidates[:1], "confirm_with_caller": True}
+
+
 # Register verification helpers for the agent to call explicitly
 FUNCTION_MAP.update({
     "verify_last4": verify_last4,
     "verify_phone": verify_phone,
+    "resolve_payment_id": resolve_payment_id,
 })
 
 
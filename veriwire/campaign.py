@@ -0,0 +1,188 @@
+import asyncio
+import heapq
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Protocol
+
+from veriwire.bank_data import DB, BankDB, Payment
+
+RETRY_OUTCOMES = {"no_answer", "busy"}
+
+
+class Dialer(Protocol):
+    async def dial(self, payment: Payment) -> str:
+        """Place the confirmation call; return 'confirmed', 'no_answer', 'busy' or 'failed'."""
+        ...
+
+
+class FakeDialer:
+    """Local stand-in for the telephony leg: rings, maybe answers, decides the wire."""
+
+    def __init__(self, db: BankDB = DB, answer_rate: float = 0.7,
+                 ring_time: float = 0.02, talk_time: float = 0.05,
+                 rng: Optional[random.Random] = None):
+        self.db = db
+        self.answer_rate = answer_rate
+        self.ring_time = ring_time
+        self.talk_time = talk_time
+        self.rng = rng or random.Random()
+        self.active = 0
+        self.peak = 0
+
+    async def dial(self, payment: Payment) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.ring_time)
+            if self.rng.random() >= self.answer_rate:
+                return "no_answer"
+            await asyncio.sleep(self.talk_time)
+            if self.rng.random() < 0.9:
+                self.db.approve(payment.id)
+            else:
+                self.db.cancel(payment.id)
+            return "confirmed"
+        finally:
+            self.active -= 1
+
+
+@dataclass(order=True)
+class _Job:
+    priority: tuple
+    payment: Payment = field(compare=False)
+    ready_at: float = field(compare=False, default=0.0)
+    attempt: int = field(compare=False, default=0)
+
+
+@dataclass
+class CampaignStats:
+    dialed: int = 0
+    confirmed: int = 0
+    unreachable: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    queue_waits: List[float] = field(default_factory=list)
+
+    def confirmations_per_hour(self) -> float:
+        return self.confirmed * 3600 / self.elapsed if self.elapsed else 0.0
+
+    def queue_wait(self, q: float) -> float:
+        if not self.queue_waits:
+            return 0.0
+        data = sorted(self.queue_waits)
+        return data[min(len(data) - 1, int(q * len(data)))]
+
+
+class CampaignScheduler:
+    """Works PENDING wires as outbound confirmations, largest and oldest first.
+
+    Concurrency is capped globally and per customer phone; no-answers are retried
+    with exponential backoff. Wires decided since they were queued are skipped.
+    """
+
+    def __init__(self, dialer: Dialer, db: BankDB = DB, max_concurrent: int = 10,
+                 per_customer: int = 1, max_attempts: int = 3, retry_base: float = 60.0):
+        # a zero limit would never dispatch and run() would wait forever
+        for name, value in (("max_concurrent", max_concurrent), ("per_customer", per_customer),
+                            ("max_attempts", max_attempts)):
+            if value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+        self.dialer = dialer
+        self.db = db
+        self.max_concurrent = max_concurrent
+        self.per_customer = per_customer
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.stats = CampaignStats()
+        self._ready: List[_Job] = []
+        self._delayed: List[tuple] = []
+        self._active: Dict[str, int] = {}
+        self._inflight = 0
+        self._seq = 0
+        self._wake: Optional[asyncio.Event] = None
+
+    @staticmethod
+    def _priority(p: Payment) -> tuple:
+        # created_at is ISO-8601, so it sorts chronologically (oldest first)
+        return (-p.amount_cents, p.created_at, p.id)
+
+    def load(self) -> int:
+        pending = self.db.pending_payments()
+        for p in pending:
+            heapq.heappush(self._ready, _Job(self._priority(p), p))
+        return len(pending)
+
+    def _is_decided(self, p: Payment) -> bool:
+        current = self.db.get_payment(p.id)
+        return current is None or current.status != "PENDING"
+
+    async def run(self) -> CampaignStats:
+        loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        start = loop.time()
+        for job in self._ready:
+            job.ready_at = start
+        tasks = set()
+
+        while self._ready or self._delayed or self._inflight:
+            now = loop.time()
+            while self._delayed and self._delayed[0][0] <= now:
+                _, _, job = heapq.heappop(self._delayed)
+                job.ready_at = now
+                heapq.heappush(self._ready, job)
+
+            blocked = []
+            while self._ready and self._inflight < self.max_concurrent:
+                job = heapq.heappop(self._ready)
+                if self._is_decided(job.payment):
+                    self.stats.skipped += 1
+                    continue
+                phone = job.payment.customer_phone
+                if self._active.get(phone, 0) >= self.per_customer:
+                    blocked.append(job)
+                    continue
+                self._active[phone] = self._active.get(phone, 0) + 1
+                self._inflight += 1
+                self.stats.queue_waits.append(now - job.ready_at)
+                tasks.add(asyncio.ensure_future(self._call(job)))
+            for job in blocked:
+                heapq.heappush(self._ready, job)
+
+            timeout = None
+            if self._delayed:
+                timeout = max(0.0, self._delayed[0][0] - loop.time())
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            tasks = {t for t in tasks if not t.done()}
+
+        self.stats.elapsed = loop.time() - start
+        return self.stats
+
+    async def _call(self, job: _Job) -> None:
+        p = job.payment
+        try:
+            self.stats.dialed += 1
+            try:
+                outcome = await self.dialer.dial(p)
+            except Exception:
+                outcome = "failed"
+
+            if outcome == "confirmed":
+                self.stats.confirmed += 1
+            elif outcome in RETRY_OUTCOMES and job.attempt + 1 < self.max_attempts:
+                job.attempt += 1
+                due = asyncio.get_running_loop().time() + self.retry_base * 2 ** (job.attempt - 1)
+                self._seq += 1
+                heapq.heappush(self._delayed, (due, self._seq, job))
+            elif outcome in RETRY_OUTCOMES:
+                self.stats.unreachable += 1
+            else:
+                self.stats.failed += 1
+        finally:
+            self._active[p.customer_phone] -= 1
+            self._inflight -= 1
+            self._wake.set()
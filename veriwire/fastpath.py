@@ -0,0 +1,244 @@
+"""Deterministic local handling of the scripted verification turns.
+
+While the call is in liveness / payment-ID / card / phone / approve-cancel, the
+bridge feeds final transcripts here and speaks the reply itself; the graph
+node functions make the same decisions the LLM flow would, without a model
+round-trip. Anything free-form hands control back to the LLM.
+"""
+from typing import Optional
+
+import requests
+
+from veriwire import prompts
+from veriwire.bank_tools import _normalize_pid, conflict_detail, resolve_payment_id
+from veriwire.graph import S, _escalate, act, dfcheck, explain, understand, verify_human
+from veriwire.resilience import CircuitOpenError
+
+MAX_TRIES = 3
+
+_NUMBER_WORDS = {
+    "zero": "0", "oh": "0", "one": "1", "two": "2", "three": "3", "four": "4",
+    "for": "4", "five": "5", "six": "6", "seven": "7", "eight": "8", "nine": "9",
+}
+_FILLER = {"my", "id", "is", "it", "uh", "um", "so", "ok", "an", "to"}
+# Questions or requests for a person are free-form dialogue, not scripted answers
+_FREE_FORM_CUES = {"why", "what", "who", "how", "human", "agent", "person", "representative", "help"}
+_YES = {"yes", "yeah", "yep", "yup", "correct", "right", "sure"}
+_NO = {"no", "nope", "nah", "wrong", "not"}
+
+
+def _spoken_payment_id(text: str) -> str:
+    out = []
+    for tok in text.lower().replace("-", " ").split():
+        tok = "".join(ch for ch in tok if ch.isalnum())
+        if tok in _NUMBER_WORDS:
+            out.append(_NUMBER_WORDS[tok])
+        elif tok in _FILLER:
+            continue
+        elif len(tok) <= 2 or any(ch.isdigit() for ch in tok):
+            out.append(tok)
+    return _normalize_pid("".join(out))
+
+
+def _is_free_form(text: str) -> bool:
+    words = {w.strip(".,!?") for w in text.lower().split()}
+    return "?" in text or bool(words & _FREE_FORM_CUES)
+
+
+def _yes_no(text: str) -> Optional[bool]:
+    words = {w.strip(".,!?") for w in text.lower().split()}
+    if words & _NO:
+        return False
+    if words & _YES:
+        return True
+    return None
+
+
+def _spell(pid: str) -> str:
+    # one character at a time, so TTS reads "10sf..." as "1 0 S F ..."
+    return " ".join(pid.upper())
+
+
+class FastPath:
+    """Per-call driver for the scripted states.
+
+    on_transcript() returns what to say next, or None once control belongs
+    to the LLM (see handed_off / handoff_context()).
+    """
+
+    def __init__(self, phrase: str, payment_id: Optional[str] = None):
+        self.state: S = {"phrase": phrase}
+        if payment_id:
+            self.state["payment_id"] = _normalize_pid(payment_id)
+        self.stage = "liveness"
+        self.turns = 0
+        self.handed_off = False
+        self.done = False
+        self.liveness_passed = False
+        self._misses = 0
+        self._candidate: Optional[str] = None
+
+    def hand_off(self) -> None:
+        self.stage = "llm"
+        self.handed_off = True
+
+    def _miss(self, say: str) -> Optional[str]:
+        self._misses += 1
+        if self._misses >= MAX_TRIES:
+            self.hand_off()
+            return None
+        return say
+
+    def _progress(self, stage: str) -> None:
+        self.stage = stage
+        self._misses = 0
+
+    def _explain(self) -> str:
+        # verify_human and understand share the "verified" flag; liveness is done,
+        # so clear it before the card last-4 step reads it.
+        self.state["verified"] = False
+        explain(self.state)
+        status = (self.state["summary"].get("status") or "").upper()
+        if status and status != "PENDING":
+            # already decided: say so, then offering a specialist is free-form
+            self.hand_off()
+        else:
+            self._progress("identity")
+        return self.state["say"]
+
+    def on_transcript(self, text: str) -> Optional[str]:
+        if self.stage in ("llm", "done") or not text.strip():
+            return None
+        self.turns += 1
+        if _is_free_form(text):
+            self.hand_off()
+            return None
+        self.state["user_text"] = text
+
+        if self.stage == "liveness":
+            verify_human(self.state)
+            if not self.state.get("verified"):
+                return self._miss(self.state["say"])
+            self.liveness_passed = True
+            dfcheck(self.state)
+            if self.state.get("payment_id"):
+                return self._fetch_and_explain()
+            self._progress("payment_id")
+            return prompts.ASK_PAYMENT_ID
+
+        if self.stage == "payment_id":
+            pid = _spoken_payment_id(text)
+            if not pid:
+                return self._miss(prompts.REPROMPT_PAYMENT_ID)
+            self.state["payment_id"] = pid
+            return self._fetch_and_explain()
+
+        if self.stage == "confirm_id":
+            answer = _yes_no(text)
+            if answer is None:
+                return self._miss(prompts.CONFIRM_PAYMENT_ID.format(spelled=_spell(self._candidate)))
+            candidate, self._candidate = self._candidate, None
+            if answer:
+                self.state["payment_id"] = candidate
+                return self._fetch_and_explain(resolved=True)
+            self.stage = "payment_id"
+            return self._miss(prompts.REPROMPT_PAYMENT_ID)
+
+        if self.stage == "identity" and self.state.get("phone_verified"):
+            # Money moves only on a bare "approve" / "cancel"; anything else
+            # ("don't approve it, cancel it", "I never approved this") is the LLM's to interpret.
+            words = [w.strip(".,!") for w in text.lower().split()]
+            if words not in (["approve"], ["cancel"]):
+                self.hand_off()
+                return None
+            self.state["intent"] = words[0]
+            return self._act()
+
+        if self.stage == "identity":
+            before = (self.state.get("verified"), self.state.get("phone_verified"))
+            understand(self.state)
+            if (self.state.get("verified"), self.state.get("phone_verified")) != before:
+                self._misses = 0
+                return self.state["say"]
+            return self._miss(self.state["say"])
+        return None
+
+    def _finish(self, say: str) -> str:
+        self.state["say"] = say
+        self.stage = "done"
+        self.done = True
+        return say
+
+    def _act(self) -> Optional[str]:
+        try:
+            act(self.state)
+        except requests.HTTPError as e:
+            # act() already handles open breakers, exhausted retries and frozen payees
+            detail = conflict_detail(e)
+            if detail is None:
+                _escalate(self.state.get("customer_phone", ""))
+                return self._finish(prompts.BANK_UNAVAILABLE)
+            # decided elsewhere since we read it; offering a specialist is free-form
+            status = detail.removeprefix("already ").upper() or "DECIDED"
+            self.state["say"] = prompts.ALREADY_DECIDED.format(status=status)
+            self.hand_off()
+            return self.state["say"]
+        except requests.RequestException:
+            _escalate(self.state.get("customer_phone", ""))
+            return self._finish(prompts.BANK_UNAVAILABLE)
+        return self._finish(self.state["say"])
+
+    def _resolve(self, heard: str) -> Optional[str]:
+        # Offer the resolver's best guess only when it is unambiguous; the caller
+        # still has to confirm it before it is used.
+        try:
+            candidates = resolve_payment_id(heard).get("candidates", [])
+        except Exception:
+            return None
+        if not candidates:
+            return None
+        if len(candidates) > 1 and candidates[1]["cost"] <= candidates[0]["cost"]:
+            return None
+        return candidates[0]["id"]
+
+    def _fetch_and_explain(self, resolved: bool = False) -> Optional[str]:
+        try:
+            return self._explain()
+        except CircuitOpenError:
+            self.hand_off()
+            return None
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                # bank error the hedged read could not hide; the LLM explains and recovers
+                self.hand_off()
+                return None
+            alt = None if resolved else self._resolve(self.state["payment_id"])
+            self.state.pop("payment_id", None)
+            self.state.pop("summary", None)
+            if alt:
+                # never switch wires silently: read the candidate back first
+                self._candidate = alt
+                self.stage = "confirm_id"
+                return prompts.CONFIRM_PAYMENT_ID.format(spelled=_spell(alt))
+            self.stage = "payment_id"
+            return self._miss(prompts.REPROMPT_PAYMENT_ID)
+        except requests.RequestException:
+            self.hand_off()
+            return None
+
+    def handoff_context(self) -> str:
+        """What the LLM needs to continue without repeating finished steps (no PII)."""
+        st = self.state
+        done = []
+        if self.liveness_passed:
+            done.append("liveness passed")
+        if st.get("summary"):
+            done.append(f"payment ID {st['payment_id']} (status {st['summary'].get('status')})")
+        if st.get("summary") and st.get("verified"):
+            done.append("card last-4 verified")
+        if st.get("phone_verified"):
+            done.append("phone verified")
+        if not done:
+            return ""
+        return ("Verification already completed on this call: " + "; ".join(done)
+                + ". Continue from there without repeating these steps.")
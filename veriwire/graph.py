@@ -1,9 +1,13 @@
 from typing import TypedDict, Optional, Literal, Dict
 
-from langgraph.graph import StateGraph, END
+import requests
 
 from veriwire.dfdetect import DeepfakeDetector
+from veriwire import prompts
+from veriwire.prompts import make_phrase
+from veriwire.resilience import CircuitOpenError, is_retryable
 from veriwire.bank_tools import (
+    conflict_detail,
     get_payment_summary,
     approve_wire,
     cancel_wire,
@@ -28,12 +32,6 @@ class S(TypedDict, total=False):
     _df: DeepfakeDetector
 
 
-def make_phrase() -> str:
-    import random
-
-    return f"{random.choice(['blue','silver','green','orange','violet'])} {random.choice(['cedar','harbor','atlas','falcon','delta'])} {random.randint(10,99)}"
-
-
 def _extract_digits_spoken(text: str) -> str:
     mapping = {
         "zero": "0", "oh": "0", "o": "0",
@@ -54,7 +52,7 @@ def _extract_digits_spoken(text: str) -> str:
 def verify_human(state: S) -> S:
     if not state.get("phrase"):
         state["phrase"] = make_phrase()
-        state["say"] = f"Please say exactly: '{state['phrase']}'"
+        state["say"] = prompts.SAY_PHRASE.format(phrase=state["phrase"])
         return state
 
     ok = all(tok in state.get("user_text", "").lower() for tok in state["phrase"].lower().split())
@@ -63,7 +61,7 @@ def verify_human(state: S) -> S:
         state["say"] = ""
     else:
         state["phrase"] = make_phrase()
-        state["say"] = f"Let's try again. Please say: '{state['phrase']}'"
+        state["say"] = prompts.RETRY_PHRASE.format(phrase=state["phrase"])
     return state
 
 
@@ -90,10 +88,10 @@ def explain(state: S) -> S:
     # If payment is already not pending, short-circuit
     status = (state["summary"].get("status") or "").upper()
     if status and status != "PENDING":
-        state["say"] = f"This payment is already {status}. If you need help, I can connect you to a specialist."
+        state["say"] = prompts.ALREADY_DECIDED.format(status=status)
         return state
 
-    state["say"] = "Before we proceed, please confirm the last four digits of the card used on this payment."
+    state["say"] = prompts.ASK_CARD_LAST4
     return state
 
 
@@ -104,10 +102,10 @@ def understand(state: S) -> S:
         digits = _extract_digits_spoken(text)
         if len(digits) == 4 and digits == state["card_last4"]:
             state["verified"] = True
-            state["say"] = "Thanks. Now please say the phone number you are calling from."
+            state["say"] = prompts.ASK_PHONE
             return state
         else:
-            state["say"] = "I didn't get that. Please say just the last four digits."
+            state["say"] = prompts.REPROMPT_LAST4
             return state
 
     # After last-4, confirm phone number matches
@@ -117,10 +115,16 @@ def understand(state: S) -> S:
         # Accept match if full last-10 provided, or if they provide a suffix of at least 7 digits matching the expected tail
         if expected and provided and (provided == expected or (len(provided) >= 7 and expected.endswith(provided)) or (provided == ("1" + expected))):
             state["phone_verified"] = True
-            state["say"] = "Thanks. Do you approve or cancel this payment?"
+            summary = state.get("summary") or {}
+            if summary.get("payee") and summary.get("amount_readable"):
+                # read back what is being decided before asking for the decision
+                state["say"] = prompts.DECISION_READ_BACK.format(
+                    amount=summary["amount_readable"], payee=summary["payee"])
+            else:
+                state["say"] = prompts.ASK_DECISION
             return state
         else:
-            state["say"] = "I didn't catch that. Please say the phone digits, for example 'four one five…'"
+            state["say"] = prompts.REPROMPT_PHONE
             return state
 
     if text == "1" or "approve" in text:
@@ -129,52 +133,89 @@ def understand(state: S) -> S:
         state["intent"] = "cancel"
     else:
         state["intent"] = "unknown"
-        state["say"] = "Please say approve or cancel."
+        state["say"] = prompts.REPROMPT_DECISION
     return state
 
 
+def _escalate(phone: str, payee: Optional[str] = None) -> None:
+    # Best effort: the bank these calls go to may be the thing that is failing,
+    # and the caller must still hear the transfer prompt.
+    if payee is not None:
+        try:
+            freeze_payee(payee)
+        except (requests.RequestException, CircuitOpenError) as e:
+            print(f"freeze_payee failed: {e!r}")
+    try:
+        schedule_fraud_specialist(phone)
+    except (requests.RequestException, CircuitOpenError) as e:
+        print(f"schedule_fraud_specialist failed: {e!r}")
+
+
 def act(state: S) -> S:
     pid = state["payment_id"]
     phone = state["customer_phone"]
     summary = state.get("summary") or {}
 
     if state.get("df_flag"):
-        try:
-            freeze_payee(summary.get("payee", "Unknown"))
-        finally:
-            schedule_fraud_specialist(phone)
-        state["say"] = "I'm detecting an issue with this line. Transferring you to a fraud specialist now."
+        _escalate(phone, payee=summary.get("payee", "Unknown"))
+        state["say"] = prompts.TRANSFER_SPECIALIST
         return state
 
-    if state.get("intent") == "approve":
-        res = approve_wire(pid)
-        state["say"] = f"Approved. Confirmation {res['id']}. Goodbye."
-    elif state.get("intent") == "cancel":
-        res = cancel_wire(pid)
-        state["say"] = f"Canceled. Ticket {res['id']}. Goodbye."
+    try:
+        if state.get("intent") == "approve":
+            res = approve_wire(pid)
+            state["say"] = f"Approved. Confirmation {res['id']}. Goodbye."
+        elif state.get("intent") == "cancel":
+            res = cancel_wire(pid)
+            state["say"] = f"Canceled. Ticket {res['id']}. Goodbye."
+    except (CircuitOpenError, requests.RequestException) as e:
+        if conflict_detail(e) == "payee frozen":
+            _escalate(phone)
+            state["say"] = prompts.PAYEE_FROZEN
+            return state
+        if not isinstance(e, CircuitOpenError) and not is_retryable(e):
+            raise
+        # Bank is failing (fast, or after the retries); hand the decision to a human instead of dead air
+        _escalate(phone)
+        state["say"] = prompts.BANK_UNAVAILABLE
     return state
 
 
-g = StateGraph(S)
-g.add_node("VerifyHuman", verify_human)
-g.add_node("DFCheck", dfcheck)
-g.add_node("Explain", explain)
-g.add_node("Understand", understand)
-g.add_node("Act", act)
-g.set_entry_point("VerifyHuman")
-g.add_edge("VerifyHuman", "DFCheck")
-g.add_conditional_edges(
-    "DFCheck",
-    lambda s: "Explain" if s.get("verified") else "VerifyHuman",
-    {"Explain": "Explain", "VerifyHuman": "VerifyHuman"},
-)
-g.add_edge("Explain", "Understand")
-g.add_conditional_edges(
-    "Understand",
-    lambda s: "Act" if s.get("intent") in {"approve", "cancel"} else "Explain",
-    {"Act": "Act", "Explain": "Explain"},
-)
-g.add_edge("Act", END)
-graph_app = g.compile()
-
-
+def build_graph():
+    # langgraph is the heaviest import in the bridge; only pay for it when the graph is used
+    from langgraph.graph import StateGraph, END
+
+    g = StateGraph(S)
+    g.add_node("VerifyHuman", verify_human)
+    g.add_node("DFCheck", dfcheck)
+    g.add_node("Explain", explain)
+    g.add_node("Understand", understand)
+    g.add_node("Act", act)
+    g.set_entry_point("VerifyHuman")
+    g.add_edge("VerifyHuman", "DFCheck")
+    g.add_conditional_edges(
+        "DFCheck",
+        lambda s: "Explain" if s.get("verified") else "VerifyHuman",
+        {"Explain": "Explain", "VerifyHuman": "VerifyHuman"},
+    )
+    g.add_edge("Explain", "Understand")
+    g.add_conditional_edges(
+        "Understand",
+        lambda s: "Act" if s.get("intent") in {"approve", "cancel"} else "Explain",
+        {"Act": "Act", "Explain": "Explain"},
+    )
+    g.add_edge("Act", END)
+    return g.compile()
+
+
+_graph_app = None
+
+
+def __getattr__(name):
+    # `from veriwire.graph import graph_app` still works; compiled on first access
+    global _graph_app
+    if name == "graph_app":
+        if _graph_app is None:
+            _graph_app = build_graph()
+        return _graph_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,229 @@
+"""Persistent registry of payees frozen for fraud.
+
+Lookups go through an in-memory Bloom filter first, so the common "not frozen"
+answer costs a few hashes regardless of blocklist size; only Bloom positives
+touch the SQLite store. The filter is persisted as a snapshot plus the keys
+frozen since it was taken, so reopening never rescans the table after a
+runtime freeze. Bulk-load a newline-delimited blocklist with:
+
+    uv run python -m veriwire.payee_registry import blocklist.txt
+"""
+import argparse
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, UTC
+from typing import Iterable, Optional
+
+_SUFFIXES = {
+    "llc", "inc", "incorporated", "corp", "corporation", "co", "company",
+    "ltd", "limited", "plc", "lp", "llp",
+}
+
+
+def normalize_payee(name: str) -> str:
+    """'ACME Escrow, L.L.C.' and 'acme escrow llc' -> 'acme escrow'."""
+    text = name.lower().replace("&", " and ")
+    text = re.sub(r"(?<=\b[a-z])\.(?=[a-z]\b)", "", text)  # l.l.c -> llc
+    words = re.sub(r"[^a-z0-9]+", " ", text).split()
+    while len(words) > 1 and words[-1] in _SUFFIXES:
+        words.pop()
+    return " ".join(words)
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, fp_rate: float = 0.01, bits: Optional[bytearray] = None):
+        self.capacity = max(1, capacity)
+        self.fp_rate = fp_rate
+        self.m = max(64, int(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / self.capacity * math.log(2)))
+        self.bits = bits if bits is not None else bytearray((self.m + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.m
+        return [(h1 + i * h2) % m for i in range(self.k)]
+
+    def add(self, key: str) -> None:
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class FrozenPayeeRegistry:
+    def __init__(self, path: str = "frozen_payees.db", capacity: int = 100_000, fp_rate: float = 0.01):
+        self.path = path
+        self.fp_rate = fp_rate
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS frozen_payees (
+                key TEXT PRIMARY KEY,
+                payee TEXT NOT NULL,
+                ticket_id TEXT,
+                frozen_at TEXT
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS bloom (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                capacity INTEGER, fp_rate REAL, count INTEGER, bits BLOB
+            );
+            -- keys frozen since the bloom snapshot; replayed on open, cleared by save()
+            CREATE TABLE IF NOT EXISTS bloom_pending (key TEXT PRIMARY KEY) WITHOUT ROWID;
+            """
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM frozen_payees").fetchone()[0]
+        self._bloom = self._load_bloom()
+        if self._bloom is None:
+            self._bloom = self._rebuild(max(capacity, 2 * self._count))
+            if self._count:
+                self.save()  # pay the scan once, not on every open
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _load_bloom(self) -> Optional[BloomFilter]:
+        row = self._conn.execute("SELECT capacity, fp_rate, count, bits FROM bloom").fetchone()
+        if not row:
+            return None
+        pending = [key for (key,) in self._conn.execute("SELECT key FROM bloom_pending")]
+        if row[2] + len(pending) != self._count:
+            return None  # stale snapshot; rebuild from the table
+        bloom = BloomFilter(row[0], row[1], bytearray(row[3]))
+        for key in pending:
+            bloom.add(key)
+        return bloom
+
+    def _rebuild(self, capacity: int) -> BloomFilter:
+        bloom = BloomFilter(capacity, self.fp_rate)
+        for (key,) in self._conn.execute("SELECT key FROM frozen_payees"):
+            bloom.add(key)
+        return bloom
+
+    def _grow_for(self, extra: int) -> bool:
+        if self._count + extra > self._bloom.capacity:
+            self._bloom = self._rebuild(2 * (self._count + extra))
+            return True
+        return False
+
+    def _snapshot(self) -> None:
+        b = self._bloom
+        self._conn.execute(
+            "INSERT OR REPLACE INTO bloom VALUES (0, ?, ?, ?, ?)",
+            (b.capacity, b.fp_rate, self._count, bytes(b.bits)),
+        )
+        self._conn.execute("DELETE FROM bloom_pending")
+
+    def save(self) -> None:
+        """Snapshot the Bloom filter so the next open skips the rebuild scan."""
+        with self._lock:
+            self._snapshot()
+            self._conn.commit()
+
+    def freeze(self, payee: str, ticket_id: Optional[str] = None) -> dict:
+        key = normalize_payee(payee)
+        ticket_id = ticket_id or f"TKT-{uuid.uuid4().hex[:8]}"
+        with self._lock:
+            grew = self._grow_for(1)
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO frozen_payees VALUES (?, ?, ?, ?)",
+                (key, payee, ticket_id, datetime.now(UTC).isoformat()),
+            )
+            self._count += cur.rowcount
+            self._bloom.add(key)
+            if grew:
+                self._snapshot()  # resized filter; the old snapshot no longer applies
+            elif cur.rowcount:
+                self._conn.execute("INSERT OR IGNORE INTO bloom_pending VALUES (?)", (key,))
+            self._conn.commit()
+            if not cur.rowcount:
+                # already frozen (maybe under a variant spelling); keep the original ticket
+                ticket_id = self._conn.execute(
+                    "SELECT ticket_id FROM frozen_payees WHERE key = ?", (key,)
+                ).fetchone()[0] or ticket_id
+        return {"payee": payee, "key": key, "ticket_id": ticket_id}
+
+    def bulk_import(self, payees: Iterable[str], batch: int = 50_000) -> int:
+        added = 0
+        now = datetime.now(UTC).isoformat()
+        rows = []
+
+        def flush():
+            nonlocal added
+            with self._lock:
+                self._grow_for(len(rows))
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO frozen_payees VALUES (?, ?, NULL, ?)", rows
+                )
+                self._conn.commit()
+                n = self._conn.total_changes - before
+                self._count += n
+                added += n
+                for key, _, _ in rows:
+                    self._bloom.add(key)
+            rows.clear()
+
+        for payee in payees:
+            payee = payee.strip()
+            if payee:
+                rows.append((normalize_payee(payee), payee, now))
+            if len(rows) >= batch:
+                flush()
+        if rows:
+            flush()
+        self.save()
+        return added
+
+    def is_frozen(self, payee: str) -> bool:
+        key = normalize_payee(payee)
+        if key not in self._bloom:
+            return False
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM frozen_payees WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        self.save()
+        self._conn.close()
+
+
+_REGISTRY: Optional[FrozenPayeeRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> FrozenPayeeRegistry:
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = FrozenPayeeRegistry(os.getenv("VERIWIRE_FROZEN_DB", "frozen_payees.db"))
+        return _REGISTRY
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m veriwire.payee_registry")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    imp = sub.add_parser("import", help="bulk-load a newline-delimited payee blocklist")
+    imp.add_argument("file")
+    imp.add_argument("--db", default=os.getenv("VERIWIRE_FROZEN_DB", "frozen_payees.db"))
+    args = parser.parse_args(argv)
+
+    reg = FrozenPayeeRegistry(args.db)
+    with open(args.file, encoding="utf-8") as f:
+        added = reg.bulk_import(f)
+    print(f"{added} payees added, {len(reg)} frozen in {args.db}")
+    reg.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Characters ASR confuses when IDs are spoken one character at a time
+# ("bee"/"dee"/"tee"/"three", "ef"/"es"/"ex"/"six", "em"/"en", ...).
+CONFUSION_CLASSES = [
+    "bcdegptvz3",
+    "ajk8h",
+    "fsx6",
+    "mn",
+    "iy",
+    "59",
+    "quw2",
+    "o0",
+]
+_CLASS_OF: Dict[str, str] = {ch: group[0] for group in CONFUSION_CLASSES for ch in group}
+_ALPHABET = sorted({_CLASS_OF.get(ch, ch) for ch in "abcdefghijklmnopqrstuvwxyz0123456789"})
+
+CONFUSABLE_COST = 0.3
+EDIT_COST = 1.0
+
+
+def _normalize(pid: str) -> str:
+    return "".join(ch for ch in pid if ch.isalnum()).lower()
+
+
+def _phone_key(phone: str) -> str:
+    digs = "".join(ch for ch in phone if ch.isdigit())
+    return digs[-10:]
+
+
+def confusion_key(pid: str) -> str:
+    """Collapse each character to its confusion class, so misheard IDs share a key."""
+    return "".join(_CLASS_OF.get(ch, ch) for ch in pid)
+
+
+def _sub_cost(a: str, b: str) -> float:
+    if a == b:
+        return 0.0
+    return CONFUSABLE_COST if _CLASS_OF.get(a, a) == _CLASS_OF.get(b, b) else EDIT_COST
+
+
+def weighted_distance(a: str, b: str) -> float:
+    prev = [j * EDIT_COST for j in range(len(b) + 1)]
+    for i, ca in enumerate(a, 1):
+        cur = [i * EDIT_COST]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + EDIT_COST, cur[j - 1] + EDIT_COST, prev[j - 1] + _sub_cost(ca, cb)))
+        prev = cur
+    return prev[-1]
+
+
+def _key_neighbors(key: str) -> Iterable[str]:
+    # keys one non-confusable edit away (substitute / delete / insert a class)
+    for i in range(len(key)):
+        head, tail = key[:i], key[i + 1:]
+        yield head + tail
+        for c in _ALPHABET:
+            if c != key[i]:
+                yield head + c + tail
+    for i in range(len(key) + 1):
+        for c in _ALPHABET:
+            yield key[:i] + c + key[i:]
+
+
+class PaymentIdIndex:
+    """Ranks known payment IDs against a possibly misheard spoken ID.
+
+    IDs are bucketed by confusion key, so any number of confusable substitutions
+    is one dict hit; one further arbitrary edit costs a few hundred more. Calls
+    constrained by phone only rank that customer's own payments.
+    """
+
+    def __init__(self) -> None:
+        # key -> id, or list of ids on collision (most keys are unique; saves memory at 10M)
+        self._by_key: Dict[str, object] = {}
+        self._by_phone: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return sum(1 if isinstance(v, str) else len(v) for v in self._by_key.values())
+
+    def add(self, pid: str, phone: Optional[str] = None) -> None:
+        pid = _normalize(pid)
+        key = confusion_key(pid)
+        cur = self._by_key.get(key)
+        if cur is None:
+            self._by_key[key] = pid
+        elif isinstance(cur, str):
+            if cur != pid:
+                self._by_key[key] = [cur, pid]
+        elif pid not in cur:
+            cur.append(pid)
+        if phone:
+            ids = self._by_phone.setdefault(_phone_key(phone), [])
+            if pid not in ids:
+                ids.append(pid)
+
+    def _bucket(self, key: str) -> List[str]:
+        cur = self._by_key.get(key)
+        if cur is None:
+            return []
+        return [cur] if isinstance(cur, str) else cur
+
+    def resolve(self, heard: str, phone: Optional[str] = None, limit: int = 3,
+                max_cost: float = 2.0) -> List[Tuple[str, float]]:
+        heard = _normalize(heard)
+        if not heard:
+            return []
+        if phone:
+            candidates = set(self._by_phone.get(_phone_key(phone), []))
+        else:
+            key = confusion_key(heard)
+            candidates = set(self._bucket(key))
+            for nk in _key_neighbors(key):
+                if nk in self._by_key:
+                    candidates.update(self._bucket(nk))
+        scored = [(pid, weighted_distance(heard, pid)) for pid in candidates]
+        scored = [(pid, cost) for pid, cost in scored if cost <= max_cost]
+        scored.sort(key=lambda item: (item[1], item[0]))
+        return scored[:limit]
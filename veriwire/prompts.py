@@ -0,0 +1,63 @@
+import random
+
+# Fixed utterances spoken by the call flow. Kept in one place so the audio
+# cache can pre-render exactly what graph.py says.
+ASK_PAYMENT_ID = "Thanks. Please say the payment ID you are calling about."
+REPROMPT_PAYMENT_ID = "I couldn't find that payment. Please say the payment ID again, one character at a time."
+ASK_CARD_LAST4 = "Before we proceed, please confirm the last four digits of the card used on this payment."
+ASK_PHONE = "Thanks. Now please say the phone number you are calling from."
+REPROMPT_LAST4 = "I didn't get that. Please say just the last four digits."
+REPROMPT_PHONE = "I didn't catch that. Please say the phone digits, for example 'four one five…'"
+ASK_DECISION = "Thanks. Do you approve or cancel this payment?"
+REPROMPT_DECISION = "Please say approve or cancel."
+TRANSFER_SPECIALIST = "I'm detecting an issue with this line. Transferring you to a fraud specialist now."
+BANK_UNAVAILABLE = "I can't complete this right now. Transferring you to a fraud specialist."
+PAYEE_FROZEN = "This payee is on hold for fraud review, so I can't approve this payment. Transferring you to a fraud specialist."
+
+# Templated utterances
+ALREADY_DECIDED = "This payment is already {status}. If you need help, I can connect you to a specialist."
+DECISION_READ_BACK = "Thanks. The payment is {amount} to {payee}. Do you approve or cancel this payment?"
+CONFIRM_PAYMENT_ID = "I found payment {spelled}. Is that the one you are calling about? Please say yes or no."
+SAY_PHRASE = "Please say exactly: '{phrase}'"
+RETRY_PHRASE = "Let's try again. Please say: '{phrase}'"
+
+GREETING_PREFIX = "Hello, this is VeriWire. For verification, please say exactly:"
+GREETING_SUFFIX = "For example: 'blue cedar 37' or 'silver harbor 42'."
+
+PHRASE_COLORS = ["blue", "silver", "green", "orange", "violet"]
+PHRASE_NOUNS = ["cedar", "harbor", "atlas", "falcon", "delta"]
+PHRASE_NUMBERS = range(10, 100)
+
+
+def make_phrase() -> str:
+    return f"{random.choice(PHRASE_COLORS)} {random.choice(PHRASE_NOUNS)} {random.randint(10, 99)}"
+
+
+def greeting_text(phrase: str) -> str:
+    return f"{GREETING_PREFIX} '{phrase}'. {GREETING_SUFFIX}"
+
+
+def greeting_segments(phrase: str) -> list:
+    # Fixed prefix/suffix around the per-call phrase so each piece caches on its own
+    return [GREETING_PREFIX, f"'{phrase}'.", GREETING_SUFFIX]
+
+
+FIXED_PROMPTS = [
+    ASK_PAYMENT_ID,
+    REPROMPT_PAYMENT_ID,
+    ASK_CARD_LAST4,
+    ASK_PHONE,
+    REPROMPT_LAST4,
+    REPROMPT_PHONE,
+    ASK_DECISION,
+    REPROMPT_DECISION,
+    TRANSFER_SPECIALIST,
+    BANK_UNAVAILABLE,
+    PAYEE_FROZEN,
+    GREETING_PREFIX,
+    GREETING_SUFFIX,
+] + [ALREADY_DECIDED.format(status=s) for s in ("APPROVED", "CANCELED")]
+
+
+def all_phrases() -> list:
+    return [f"{c} {n} {i}" for c in PHRASE_COLORS for n in PHRASE_NOUNS for i in PHRASE_NUMBERS]
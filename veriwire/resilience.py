@@ -0,0 +1,215 @@
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Optional, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit breaker is open."""
+
+    def __init__(self, endpoint: str):
+        super().__init__(f"circuit open for {endpoint}")
+        self.endpoint = endpoint
+
+
+def is_retryable(exc: BaseException) -> bool:
+    # Transport failures and 5xx are worth another attempt; 4xx (404/409) are answers.
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        return exc.response.status_code >= 500
+    return False
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 200, min_samples: int = 20,
+                 default_delay: float = 0.25, floor: float = 0.01):
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.floor = floor
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            data = sorted(self._samples)
+        if not data:
+            return None
+        idx = min(len(data) - 1, int(q * len(data)))
+        return data[idx]
+
+    def hedge_delay(self) -> float:
+        if len(self._samples) < self.min_samples:
+            return self.default_delay
+        return max(self.floor, self.percentile(0.95))
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                # let exactly one probe through; its outcome closes or reopens
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+            self._trial_in_flight = False
+
+
+class Endpoint:
+    def __init__(self, name: str, breaker: Optional[CircuitBreaker] = None,
+                 tracker: Optional[LatencyTracker] = None,
+                 sleep: Callable[[float], None] = time.sleep, max_in_flight: int = 8):
+        self.name = name
+        self.breaker = breaker or CircuitBreaker()
+        self.tracker = tracker or LatencyTracker()
+        self._sleep = sleep
+        # Hedged-read workers, per endpoint and bounded: one slot per worker, so an
+        # attempt never queues behind stalled losers still holding a worker.
+        self.max_in_flight = max_in_flight
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def _admit(self) -> None:
+        if not self.breaker.allow():
+            raise CircuitOpenError(self.name)
+
+    def _timed(self, fn: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        result = fn()
+        self.tracker.record(time.perf_counter() - start)
+        return result
+
+    def _settle(self, exc: BaseException) -> None:
+        if is_retryable(exc):
+            self.breaker.record_failure()
+        else:
+            # the bank answered (e.g. 404/409); the endpoint itself is healthy
+            self.breaker.record_success()
+
+    def _direct(self, fn: Callable[[], T]) -> T:
+        try:
+            result = self._timed(fn)
+        except Exception as exc:
+            self._settle(exc)
+            raise
+        self.breaker.record_success()
+        return result
+
+    def _spawn(self, fn: Callable[[], T]) -> Optional[Future]:
+        # None when every worker is busy (typically with stalled attempts)
+        if not self._slots.acquire(blocking=False):
+            return None
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_in_flight,
+                                                thread_name_prefix=f"veriwire-{self.name}")
+        fut = self._pool.submit(self._timed, fn)
+        fut.add_done_callback(lambda _: self._slots.release())
+        return fut
+
+    def call(self, fn: Callable[[], T]) -> T:
+        self._admit()
+        return self._direct(fn)
+
+    def hedged(self, fn: Callable[[], T]) -> T:
+        """Run a read; if it outlives the p95 delay, race a second copy."""
+        self._admit()
+        primary = self._spawn(fn)
+        if primary is None:
+            # saturated: run unhedged on the caller's thread rather than queue
+            return self._direct(fn)
+        futures = [primary]
+        done, _ = wait(futures, timeout=self.tracker.hedge_delay())
+        if not done:
+            hedge = self._spawn(fn)
+            if hedge is not None:
+                futures.append(hedge)
+
+        pending = set(futures)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                exc = fut.exception()
+                if exc is None:
+                    self.breaker.record_success()
+                    return fut.result()
+                if not is_retryable(exc):
+                    self._settle(exc)
+                    raise exc
+                error = exc
+        self.breaker.record_failure()
+        raise error
+
+    def retried(self, fn: Callable[[], T], attempts: int = 3,
+                base_delay: float = 0.1, max_delay: float = 1.0) -> T:
+        """Retry transient failures with full-jitter backoff. fn must be idempotent."""
+        for attempt in range(attempts):
+            self._admit()
+            try:
+                result = self._timed(fn)
+            except Exception as exc:
+                self._settle(exc)
+                if not is_retryable(exc) or attempt == attempts - 1:
+                    raise
+                self._sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+            else:
+                self.breaker.record_success()
+                return result
+        raise ValueError("attempts must be >= 1")
+
+
+ENDPOINTS: Dict[str, Endpoint] = {}
+_ENDPOINTS_LOCK = threading.Lock()
+
+
+def endpoint(name: str) -> Endpoint:
+    with _ENDPOINTS_LOCK:
+        ep = ENDPOINTS.get(name)
+        if ep is None:
+            ep = ENDPOINTS[name] = Endpoint(name)
+        return ep
@@ -1,11 +1,17 @@
 from datetime import datetime, UTC
 from typing import Optional
+import threading
 
 from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-engine = create_engine("sqlite:///veriwire.db", echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+DB_URL = "sqlite:///veriwire.db"
+
+# The engine and tables are created on first use (normally by init_db after the
+# bridge is listening), so an early log_event never races table creation
+_engine = None
+_engine_lock = threading.Lock()
+SessionLocal = sessionmaker(autoflush=False, autocommit=False)
 Base = declarative_base()
 
 
@@ -25,14 +31,25 @@ class Event(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(UTC))
 
 
+def get_engine():
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(DB_URL, echo=False, future=True)
+                Base.metadata.create_all(bind=engine)
+                SessionLocal.configure(bind=engine)
+                _engine = engine  # published only once the tables exist
+    return _engine
+
+
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    get_engine()
 
 
 def log_event(streamsid: str, kind: str, data: Optional[str] = None) -> None:
+    get_engine()
     with SessionLocal() as db:
         evt = Event(streamsid=streamsid, kind=kind, data=data or "")
         db.add(evt)
         db.commit()
-
-
@@ -0,0 +1,159 @@
+"""How bank_tools reaches the bank sandbox.
+
+Selected with VERIWIRE_BANK_TRANSPORT:
+
+* ``http`` (default) — keep-alive HTTP to VERIWIRE_BANK_URL
+* ``uds`` — HTTP over the Unix socket VERIWIRE_BANK_SOCKET
+  (``uvicorn api.bank_sandbox:app --uds /tmp/veriwire-bank.sock``)
+* ``inprocess`` — call the sandbox handlers directly when co-located
+
+Every transport returns the decoded JSON body and raises requests.HTTPError
+(404/409/...) or requests.ConnectionError exactly like the HTTP path, so the
+resilience layer and callers behave the same whichever is configured.
+"""
+import http.client
+import json
+import os
+import socket
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+DEFAULT_BASE = "http://127.0.0.1:8000"
+DEFAULT_SOCKET = "/tmp/veriwire-bank.sock"
+TIMEOUT = 5
+
+
+def _http_error(status: int, body: bytes = b"") -> requests.HTTPError:
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    return requests.HTTPError(f"{status} Error", response=resp)
+
+
+class HttpTransport:
+    def __init__(self, base: str = DEFAULT_BASE):
+        self.base = base.rstrip("/")
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        # one keep-alive session per thread (hedged reads run on a pool)
+        s = getattr(self._local, "session", None)
+        if s is None:
+            s = self._local.session = requests.Session()
+        return s
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                headers: Optional[Dict] = None):
+        r = self._session().request(method, f"{self.base}{path}", params=params,
+                                    headers=headers, timeout=TIMEOUT)
+        r.raise_for_status()
+        return r.json()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+# What a keep-alive socket the server has already closed looks like on reuse
+_STALE_ERRORS = (BrokenPipeError, ConnectionResetError, ConnectionAbortedError,
+                 http.client.RemoteDisconnected)
+
+
+class UnixSocketTransport:
+    def __init__(self, path: str = DEFAULT_SOCKET):
+        self.path = path
+        self._local = threading.local()
+
+    def _conn(self) -> _UnixHTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _UnixHTTPConnection(self.path, TIMEOUT)
+        return conn
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                headers: Optional[Dict] = None):
+        url = f"{path}?{urlencode(params)}" if params else path
+        for attempt in range(2):
+            conn = self._conn()
+            reused = conn.sock is not None
+            try:
+                conn.request(method, url, headers=headers or {})
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                self._local.conn = None
+                if reused and attempt == 0 and isinstance(e, _STALE_ERRORS):
+                    # the server closed the idle socket before reading our request
+                    # (uvicorn keep-alive is 5 s); resend once on a fresh connection
+                    continue
+                raise requests.ConnectionError(str(e)) from e
+        if resp.status >= 400:
+            raise _http_error(resp.status, body)
+        return json.loads(body)
+
+
+class InProcessTransport:
+    """Calls the sandbox route handlers directly: same BankDB, same 404/409 rules."""
+
+    def __init__(self):
+        from api import bank_sandbox
+
+        self.sandbox = bank_sandbox
+
+    def _dispatch(self, method: str, path: str, params: Dict, headers: Dict):
+        sb = self.sandbox
+        parts = path.strip("/").split("/")
+        if method == "GET" and len(parts) == 2 and parts[0] == "payments":
+            return sb.get_payment(parts[1])
+        if method == "POST" and len(parts) == 3 and parts[0] == "payments":
+            key = headers.get("Idempotency-Key")
+            if parts[2] == "approve":
+                return sb.approve_payment(parts[1], key)
+            if parts[2] == "cancel":
+                return sb.cancel_payment(parts[1], key)
+        if method == "GET" and path == "/resolve_payment":
+            return sb.resolve_payment(params["q"], params.get("phone"), int(params.get("limit", 3)))
+        if method == "POST" and path == "/freeze_payee":
+            return sb.freeze_payee(params["payee"])
+        if method == "POST" and path == "/schedule_specialist":
+            return sb.schedule_specialist(params["phone"])
+        raise _http_error(404)
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                headers: Optional[Dict] = None):
+        from fastapi import HTTPException
+
+        try:
+            body = self._dispatch(method, path, params or {}, headers or {})
+        except HTTPException as e:
+            detail = json.dumps({"detail": e.detail}).encode()
+            raise _http_error(e.status_code, detail) from None
+        # hand back a copy, as a decoded HTTP body would be
+        return dict(body)
+
+
+_TRANSPORTS = {
+    "http": lambda: HttpTransport(os.getenv("VERIWIRE_BANK_URL", DEFAULT_BASE)),
+    "uds": lambda: UnixSocketTransport(os.getenv("VERIWIRE_BANK_SOCKET", DEFAULT_SOCKET)),
+    "inprocess": InProcessTransport,
+}
+
+
+def make_transport(kind: Optional[str] = None):
+    kind = (kind or os.getenv("VERIWIRE_BANK_TRANSPORT", "http")).lower()
+    if kind not in _TRANSPORTS:
+        raise ValueError(f"unknown bank transport {kind!r}; expected one of {sorted(_TRANSPORTS)}")
+    return _TRANSPORTS[kind]()